@@ -7,16 +7,44 @@ Usage:
 """
 
 import boto3
-import json
+import functools
 import sys
 import uuid
 import os
 
+try:
+    import orjson
+
+    def _dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None).encode()
+
+    _loads = json.loads
+
 # Configuration - Update these values with your agent details or set environment variables
 # Example: export AGENT_ARN="arn:aws:bedrock-agentcore:region:account:runtime/agent-id"
 AGENT_ARN = os.environ.get("AGENT_ARN", "arn:aws:bedrock-agentcore:ap-south-1:YOUR_ACCOUNT_ID:runtime/YOUR_AGENT_ID")
 AWS_REGION = os.environ.get("AWS_REGION", "ap-south-1")
 
+# Read size for the SSE stream. StreamingBody.read(amt) blocks until amt bytes
+# arrive, so this stays small enough that events are still shown as they stream.
+SSE_CHUNK_SIZE = 1024
+
+# One session per process so credentials and service models load once
+_session = boto3.session.Session()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_agentcore_client(region: str):
+    """Return a cached Bedrock AgentCore client for the given region."""
+    return _session.client('bedrock-agentcore', region_name=region)
+
 
 def invoke_agent(prompt: str, agent_arn: str = AGENT_ARN, region: str = AWS_REGION):
     """
@@ -27,8 +55,8 @@ def invoke_agent(prompt: str, agent_arn: str = AGENT_ARN, region: str = AWS_REGI
         agent_arn: ARN of the deployed agent runtime
         region: AWS region where the agent is deployed
     """
-    # Initialize the Bedrock AgentCore client
-    agent_core_client = boto3.client('bedrock-agentcore', region_name=region)
+    # Reuse the Bedrock AgentCore client for this region
+    agent_core_client = _get_agentcore_client(region)
     
     # Generate a unique session ID (must be at least 33 characters)
     session_id = f"session-{uuid.uuid4()}"
@@ -38,7 +66,7 @@ def invoke_agent(prompt: str, agent_arn: str = AGENT_ARN, region: str = AWS_REGI
     print(f"Session ID: {session_id}")
     
     # Prepare the payload
-    payload = json.dumps({"prompt": prompt}).encode()
+    payload = _dumps({"prompt": prompt})
     
     try:
         # Invoke the agent
@@ -52,27 +80,28 @@ def invoke_agent(prompt: str, agent_arn: str = AGENT_ARN, region: str = AWS_REGI
         if "text/event-stream" in response.get("contentType", ""):
             # Handle streaming response
             print("Streaming response:")
-            content = []
-            for line in response["response"].iter_lines(chunk_size=10):
-                if line:
-                    line = line.decode("utf-8")
-                    if line.startswith("data: "):
-                        line = line[6:]
-                        print(line)
-                        content.append(line)
+            sys.stdout.flush()
+            out = sys.stdout.buffer
+            content = bytearray()
+            for line in response["response"].iter_lines(chunk_size=SSE_CHUNK_SIZE):
+                if line.startswith(b"data: "):
+                    data = line[6:]
+                    out.write(data)
+                    out.write(b"\n")
+                    out.flush()
+                    content += data
+                    content += b"\n"
             
             print("Complete response:")
-            print("\n".join(content))
+            print(content.decode("utf-8").rstrip("\n"))
         
         elif response.get("contentType") == "application/json":
-            # Handle standard JSON response
-            content = []
-            for chunk in response.get("response", []):
-                content.append(chunk.decode('utf-8'))
-            
-            response_data = json.loads(''.join(content))
+            # Handle standard JSON response (bytes in, bytes out - never decoded)
+            response_data = _loads(b"".join(response.get("response", [])))
             print("JSON response:")
-            print(json.dumps(response_data, indent=2))
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_dumps(response_data, indent=True) + b"\n")
+            sys.stdout.buffer.flush()
         
         else:
             # Print raw response for other content types
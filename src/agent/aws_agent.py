@@ -1,190 +1,228 @@
 """Langgraph agent implementation for AWS resource management."""
 
+import asyncio
+import logging
 import os
-from typing import Dict, Any, List, Optional, TypedDict, Annotated, Sequence
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage, SystemMessage
+import time
+from functools import cached_property, lru_cache, partial
+from typing import (
+    Dict, Any, List, Optional, TypedDict, Annotated, Sequence, Tuple, Callable, Awaitable,
+    AsyncIterator, Set, TYPE_CHECKING
+)
+from langchain_core.messages import (
+    BaseMessage, HumanMessage, ToolMessage, SystemMessage, message_chunk_to_message
+)
 from langchain_core.tools import BaseTool, StructuredTool, tool
 import operator
+from pydantic import BaseModel, Field
 import structlog
 
-from bedrock import BedrockClient
-from bedrock.langchain_integration import create_bedrock_llm, create_agent_prompt
-from mcp_tools import (
-    CreateS3BucketTool,
-    ListS3BucketsTool,
-    DeleteS3BucketTool,
-    GetS3BucketInfoTool,
-    CreateLambdaFunctionTool,
-    ListLambdaFunctionsTool,
-    UpdateLambdaConfigTool,
-    DeleteLambdaFunctionTool,
-    GetLambdaFunctionInfoTool,
-    CreateDynamoDBTableTool,
-    ListDynamoDBTablesTool,
-    DescribeDynamoDBTableTool,
-    DeleteDynamoDBTableTool,
-    UpdateDynamoDBTableTool,
-)
 from config import settings
-from memory import create_memory_session, MemorySession
+from utils import run_in_background_loop
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+    from mcp_tools import BaseMCPTool
+    from memory import MemorySession
 
 logger = structlog.get_logger()
 
+# System prompt for the agent, with memory awareness; built once and shared by every turn
+SYSTEM_MESSAGE = SystemMessage(content="""You are an AI assistant specialized in managing AWS resources.
+You can help users create, configure, manage, and monitor AWS resources including S3 buckets,
+Lambda functions, and DynamoDB tables.
+
+MEMORY CAPABILITIES:
+- You have access to conversation history using the list_conversation_history tool
+- ALWAYS use this tool first when a user asks about previous conversations, their name, 
+  projects they mentioned, or any contextual information from earlier interactions
+- If a user asks "what is my name" or "what did we discuss", USE the list_conversation_history tool
+
+Key capabilities:
+- Create and configure S3 buckets
+- Create, update, and manage Lambda functions  
+- Create, configure, and manage DynamoDB tables
+
+When several independent tool calls are needed, request them together in the same turn
+(or through the batch_tool_calls tool) so they run in parallel.
+
+When listing resources, ALWAYS show the actual data returned by tools.
+Always prioritize security best practices.""")
+
+# Upper bound on tool calls from a single LLM turn that run at the same time
+MAX_CONCURRENT_TOOL_CALLS = 8
+
+# Name of the meta-tool that fans a list of tool calls out in one LLM turn
+BATCH_TOOL_NAME = "batch_tool_calls"
+
+
+class BatchInvocation(BaseModel):
+    """A single tool call inside a batch."""
+    name: str = Field(..., description="Name of the tool to call")
+    args: Dict[str, Any] = Field(default_factory=dict, description="Arguments for the tool")
+
+
+class BatchToolInput(BaseModel):
+    """Input for the batch meta-tool."""
+    invocations: List[BatchInvocation] = Field(
+        ..., description="Independent tool calls to run together"
+    )
+
+# Background memory writes; holding references keeps the tasks from being
+# garbage collected before they finish
+_pending_memory_writes: Set["asyncio.Task[Any]"] = set()
+
 
 class AgentState(TypedDict):
     """State for the agent graph."""
     messages: Annotated[Sequence[BaseMessage], operator.add]
+    # Tool result contents produced during this run, appended as tools execute
+    tool_results: Annotated[List[str], operator.add]
+
+
+def _tool_classes() -> Tuple[type, ...]:
+    """MCP tool classes exposed to the agent, in the order they are registered.
+    
+    mcp_tools is imported here rather than at module load so importing the
+    agent module stays cheap; the tools are only needed once an agent is built.
+    """
+    from mcp_tools import (
+        CreateS3BucketTool,
+        ListS3BucketsTool,
+        DeleteS3BucketTool,
+        GetS3BucketInfoTool,
+        CreateLambdaFunctionTool,
+        ListLambdaFunctionsTool,
+        UpdateLambdaConfigTool,
+        DeleteLambdaFunctionTool,
+        GetLambdaFunctionInfoTool,
+        CreateDynamoDBTableTool,
+        ListDynamoDBTablesTool,
+        DescribeDynamoDBTableTool,
+        DeleteDynamoDBTableTool,
+        UpdateDynamoDBTableTool,
+    )
+    return (
+        # S3 Tools
+        CreateS3BucketTool,
+        ListS3BucketsTool,
+        DeleteS3BucketTool,
+        GetS3BucketInfoTool,
+        # Lambda Tools
+        CreateLambdaFunctionTool,
+        ListLambdaFunctionsTool,
+        UpdateLambdaConfigTool,
+        DeleteLambdaFunctionTool,
+        GetLambdaFunctionInfoTool,
+        # DynamoDB Tools
+        CreateDynamoDBTableTool,
+        ListDynamoDBTablesTool,
+        DescribeDynamoDBTableTool,
+        DeleteDynamoDBTableTool,
+        UpdateDynamoDBTableTool,
+    )
+
+
+# Pre-bound MCP tool instance and async entry point per tool class, built once per process
+_TOOL_WRAPPERS: Dict[type, Tuple["BaseMCPTool", Callable[..., Awaitable[str]]]] = {}
+
+
+def _content_text(content: Any) -> str:
+    """Extract the text from message content (a string or a list of content blocks)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else block.get("text", "")
+            for block in content
+            if isinstance(block, str) or block.get("type") == "text"
+        )
+    return str(content)
+
+
+def _log_previews_enabled() -> bool:
+    """Whether INFO events (and so content previews) are logged at the configured level.
+    
+    Reads settings.log_level, which setup_logging applies to both the
+    structlog fast path and the stdlib root logger, instead of the root
+    logger's level, which is WARNING until setup_logging runs.
+    """
+    return getattr(logging, settings.log_level.upper(), logging.INFO) <= logging.INFO
+
+
+async def _call_mcp_tool(tool_instance: "BaseMCPTool", **kwargs: Any) -> str:
+    """Run an MCP tool with arguments LangChain has already validated.
+    
+    StructuredTool validates the arguments against ``input_model`` (the
+    tool's ``args_schema``), so the model is built without a second
+    validation pass. Tools flagged ``blocking`` make synchronous boto3 calls
+    inside ``execute``, so they run on a worker thread; otherwise gathered
+    tool calls would still execute one after another on the event loop.
+    """
+    input_data = tool_instance.input_model.model_construct(**kwargs)
+    if tool_instance.blocking:
+        result = await asyncio.to_thread(_run_blocking_tool, tool_instance, input_data)
+    else:
+        result = await tool_instance.execute(input_data)
+    # Convert ToolOutput to string for LangChain
+    return str(result)
+
+
+def _run_blocking_tool(tool_instance: "BaseMCPTool", input_data: Any) -> Any:
+    """Drive a blocking tool's execute coroutine to completion on the calling (worker) thread."""
+    return asyncio.run(tool_instance.execute(input_data))
+
+
+def _make_coroutine(tool_instance: "BaseMCPTool") -> Callable[..., Awaitable[str]]:
+    """Bind the shared async entry point to an MCP tool instance."""
+    return partial(_call_mcp_tool, tool_instance)
+
+
+def _get_tool_wrapper(tool_class) -> Tuple["BaseMCPTool", Callable[..., Awaitable[str]]]:
+    """Return the cached tool instance and coroutine for an MCP tool class."""
+    wrapper = _TOOL_WRAPPERS.get(tool_class)
+    if wrapper is None:
+        tool_instance = tool_class()
+        wrapper = _TOOL_WRAPPERS[tool_class] = (tool_instance, _make_coroutine(tool_instance))
+    return wrapper
+
+
+def _make_tool(tool_class) -> BaseTool:
+    """Wrap an MCP tool as a LangChain StructuredTool.
+    
+    MCP tools are async-only, so no sync ``func`` is registered; LangChain
+    raises a clear error if the tool is ever invoked synchronously.
+    """
+    tool_instance, coroutine = _get_tool_wrapper(tool_class)
+    return StructuredTool.from_function(
+        name=tool_instance.name,
+        description=tool_instance.description,
+        args_schema=tool_instance.input_model,
+        coroutine=coroutine,
+        metadata={"serialize": tool_instance.serialize}
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_langchain_tools() -> Tuple[BaseTool, ...]:
+    """Build the MCP-backed LangChain tools once per process."""
+    return tuple(_make_tool(tool_class) for tool_class in _tool_classes())
 
 
 def create_langchain_tools() -> List[BaseTool]:
     """Create Langchain-compatible tools from MCP tools.
     
+    The tools are built once per process; each call returns a new list so
+    callers can extend it without affecting other agents.
+    
     Returns:
         List of Langchain tools
     """
-    tools = []
-    
-    def create_tool_wrapper(tool_instance):
-        """Create a wrapper function for async tool execution."""
-        async def wrapper(**kwargs):
-            input_data = tool_instance.input_model(**kwargs)
-            result = await tool_instance.execute(input_data)
-            # Convert ToolOutput to string for LangChain
-            return str(result)
-        return wrapper
-
-    # S3 Tools
-    s3_create = CreateS3BucketTool()
-    tools.append(StructuredTool.from_function(
-        name=s3_create.name,
-        description=s3_create.description,
-        args_schema=s3_create.input_model,
-        func=lambda **kwargs: str(s3_create.execute(s3_create.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(s3_create)
-    ))
-
-    s3_list = ListS3BucketsTool()
-    tools.append(StructuredTool.from_function(
-        name=s3_list.name,
-        description=s3_list.description,
-        args_schema=s3_list.input_model,
-        func=lambda **kwargs: str(s3_list.execute(s3_list.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(s3_list)
-    ))
-
-    s3_delete = DeleteS3BucketTool()
-    tools.append(StructuredTool.from_function(
-        name=s3_delete.name,
-        description=s3_delete.description,
-        args_schema=s3_delete.input_model,
-        func=lambda **kwargs: str(s3_delete.execute(s3_delete.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(s3_delete)
-    ))
-
-    s3_info = GetS3BucketInfoTool()
-    tools.append(StructuredTool.from_function(
-        name=s3_info.name,
-        description=s3_info.description,
-        args_schema=s3_info.input_model,
-        func=lambda **kwargs: str(s3_info.execute(s3_info.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(s3_info)
-    ))
-
-    # Lambda Tools
-    lambda_create = CreateLambdaFunctionTool()
-    tools.append(StructuredTool.from_function(
-        name=lambda_create.name,
-        description=lambda_create.description,
-        args_schema=lambda_create.input_model,
-        func=lambda **kwargs: str(lambda_create.execute(lambda_create.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(lambda_create)
-    ))
-
-    lambda_list = ListLambdaFunctionsTool()
-    tools.append(StructuredTool.from_function(
-        name=lambda_list.name,
-        description=lambda_list.description,
-        args_schema=lambda_list.input_model,
-        func=lambda **kwargs: str(lambda_list.execute(lambda_list.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(lambda_list)
-    ))
-
-    lambda_update = UpdateLambdaConfigTool()
-    tools.append(StructuredTool.from_function(
-        name=lambda_update.name,
-        description=lambda_update.description,
-        args_schema=lambda_update.input_model,
-        func=lambda **kwargs: str(lambda_update.execute(lambda_update.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(lambda_update)
-    ))
-
-    lambda_delete = DeleteLambdaFunctionTool()
-    tools.append(StructuredTool.from_function(
-        name=lambda_delete.name,
-        description=lambda_delete.description,
-        args_schema=lambda_delete.input_model,
-        func=lambda **kwargs: str(lambda_delete.execute(lambda_delete.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(lambda_delete)
-    ))
-
-    lambda_info = GetLambdaFunctionInfoTool()
-    tools.append(StructuredTool.from_function(
-        name=lambda_info.name,
-        description=lambda_info.description,
-        args_schema=lambda_info.input_model,
-        func=lambda **kwargs: str(lambda_info.execute(lambda_info.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(lambda_info)
-    ))
-
-    # DynamoDB Tools
-    ddb_create = CreateDynamoDBTableTool()
-    tools.append(StructuredTool.from_function(
-        name=ddb_create.name,
-        description=ddb_create.description,
-        args_schema=ddb_create.input_model,
-        func=lambda **kwargs: str(ddb_create.execute(ddb_create.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(ddb_create)
-    ))
-
-    ddb_list = ListDynamoDBTablesTool()
-    tools.append(StructuredTool.from_function(
-        name=ddb_list.name,
-        description=ddb_list.description,
-        args_schema=ddb_list.input_model,
-        func=lambda **kwargs: str(ddb_list.execute(ddb_list.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(ddb_list)
-    ))
-
-    ddb_describe = DescribeDynamoDBTableTool()
-    tools.append(StructuredTool.from_function(
-        name=ddb_describe.name,
-        description=ddb_describe.description,
-        args_schema=ddb_describe.input_model,
-        func=lambda **kwargs: str(ddb_describe.execute(ddb_describe.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(ddb_describe)
-    ))
-
-    ddb_delete = DeleteDynamoDBTableTool()
-    tools.append(StructuredTool.from_function(
-        name=ddb_delete.name,
-        description=ddb_delete.description,
-        args_schema=ddb_delete.input_model,
-        func=lambda **kwargs: str(ddb_delete.execute(ddb_delete.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(ddb_delete)
-    ))
-
-    ddb_update = UpdateDynamoDBTableTool()
-    tools.append(StructuredTool.from_function(
-        name=ddb_update.name,
-        description=ddb_update.description,
-        args_schema=ddb_update.input_model,
-        func=lambda **kwargs: str(ddb_update.execute(ddb_update.input_model(**kwargs))),
-        coroutine=create_tool_wrapper(ddb_update)
-    ))
-
-    return tools
+    return list(_build_langchain_tools())
+
+
+# Gateway tools from the last successful load; failures are retried on the next call
+_gateway_tools: Optional[Tuple[BaseTool, ...]] = None
 
 
 def load_gateway_tools() -> List[BaseTool]:
@@ -193,6 +231,10 @@ def load_gateway_tools() -> List[BaseTool]:
     Returns:
         List of LangChain tools from gateway, or empty list if unavailable
     """
+    global _gateway_tools
+    if _gateway_tools is not None:
+        return list(_gateway_tools)
+    
     try:
         from gateway_integration import MCPGatewayClient, create_gateway_tools
         
@@ -216,6 +258,7 @@ def load_gateway_tools() -> List[BaseTool]:
         logger.info("gateway_tools_loaded", 
                    count=len(tools), 
                    tools=[t.name for t in tools])
+        _gateway_tools = tuple(tools)
         return tools
         
     except ImportError as e:
@@ -259,8 +302,10 @@ class AWSResourceAgent:
                 self.logger.info("gateway_tools_added", count=len(gateway_tools))
         
         # Initialize memory session for short-term memory
-        self.memory_session: Optional[MemorySession] = None
+        self.memory_session: Optional["MemorySession"] = None
         if settings.memory_enabled:
+            from memory import create_memory_session
+            
             self.memory_session = create_memory_session(
                 memory_id=memory_id,
                 actor_id=actor_id,
@@ -275,13 +320,17 @@ class AWSResourceAgent:
                     session_id=self.memory_session.session_id
                 )
         
+        self.tools.append(self._create_batch_tool())
+        
+        from bedrock.langchain_integration import create_bedrock_llm, bind_agent_tools
+        
         self.llm = create_bedrock_llm()
         
-        # Bind tools to LLM for function calling
-        self.llm_with_tools = self.llm.bind_tools(self.tools)
+        # Bind tools to LLM for function calling (schemas are converted once here)
+        self.llm_with_tools = bind_agent_tools(self.llm, self.tools)
         
-        self.tool_node = ToolNode(self.tools)
-        self.graph = self._create_graph()
+        self._tools_by_name = {t.name: t for t in self.tools}
+        self._serial_tools = {t.name for t in self.tools if (t.metadata or {}).get("serialize")}
         
         self.logger.info(
             "agent_initialized",
@@ -317,17 +366,60 @@ class AWSResourceAgent:
         
         return list_conversation_history
 
-    def _create_graph(self) -> StateGraph:
+    def _create_batch_tool(self) -> BaseTool:
+        """Create the meta-tool that runs several tool calls in one step.
+        
+        Calls are dispatched like tool calls from a single LLM turn: read-only
+        tools concurrently, mutating tools one at a time afterwards.
+        
+        Returns:
+            LangChain tool wrapping _run_tool_calls
+        """
+        async def batch_tool_calls(invocations: List[Any]) -> str:
+            tool_calls = []
+            for inv in invocations:
+                if not isinstance(inv, BatchInvocation):
+                    inv = BatchInvocation.model_validate(inv)
+                if inv.name == BATCH_TOOL_NAME:
+                    raise ValueError(f"{BATCH_TOOL_NAME} cannot be nested")
+                tool_calls.append({"name": inv.name, "args": inv.args})
+            results = await self._run_tool_calls(tool_calls)
+            
+            sections = []
+            for tool_call, result in zip(tool_calls, results):
+                if isinstance(result, BaseException):
+                    result = f"Error executing {tool_call['name']}: {str(result)}"
+                sections.append(f"[{tool_call['name']}]\n{result}")
+            return "\n\n".join(sections)
+        
+        return StructuredTool.from_function(
+            name=BATCH_TOOL_NAME,
+            description=(
+                "Run several independent tool calls at once and return all of their results. "
+                "Use this to look up multiple resources in a single step."
+            ),
+            args_schema=BatchToolInput,
+            coroutine=batch_tool_calls
+        )
+
+    @cached_property
+    def graph(self):
+        """Compiled Langgraph workflow, built once and reused by every execute()."""
+        return self._create_graph()
+
+    def _create_graph(self) -> "StateGraph":
         """Create the Langgraph state graph.
         
         Returns:
             State graph
         """
+        from langgraph.graph import StateGraph, END
+        
         workflow = StateGraph(AgentState)
 
         # Add nodes
         workflow.add_node("agent", self._run_agent)
-        workflow.add_node("action", self.tool_node)
+        workflow.add_node("action", self._execute_tool)
 
         # Set entry point
         workflow.set_entry_point("agent")
@@ -360,42 +452,38 @@ class AWSResourceAgent:
         
         self.logger.info("agent_reasoning", message_count=len(messages))
         
-        # Build system message with memory awareness
-        system_content = """You are an AI assistant specialized in managing AWS resources.
-You can help users create, configure, manage, and monitor AWS resources including S3 buckets,
-Lambda functions, and DynamoDB tables.
-
-MEMORY CAPABILITIES:
-- You have access to conversation history using the list_conversation_history tool
-- ALWAYS use this tool first when a user asks about previous conversations, their name, 
-  projects they mentioned, or any contextual information from earlier interactions
-- If a user asks "what is my name" or "what did we discuss", USE the list_conversation_history tool
-
-Key capabilities:
-- Create and configure S3 buckets
-- Create, update, and manage Lambda functions  
-- Create, configure, and manage DynamoDB tables
-
-When listing resources, ALWAYS show the actual data returned by tools.
-Always prioritize security best practices."""
-
-        # Prepend system message if not already present
+        # Runs started by _initial_state already carry the system message; only
+        # copy-and-prepend for state built elsewhere
         if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=system_content)] + list(messages)
-        
-        # Invoke LLM with tools to get decision
-        response = await self.llm_with_tools.ainvoke(messages)
-        
-        self.logger.info(
-            "llm_response",
-            has_tool_calls=bool(response.tool_calls) if hasattr(response, 'tool_calls') else False,
-            content_preview=response.content[:100] if response.content else None
-        )
+            messages = [SYSTEM_MESSAGE, *messages]
+        
+        # Stream the LLM decision so tokens reach stream() consumers as they are
+        # generated, then merge the chunks into a single message for the state
+        response = None
+        async for chunk in self.llm_with_tools.astream(messages):
+            response = chunk if response is None else response + chunk
+        if response is None:
+            # The model produced no chunks; fall back to a non-streaming call
+            self.logger.warning("llm_stream_empty")
+            response = await self.llm_with_tools.ainvoke(messages)
+        else:
+            response = message_chunk_to_message(response)
+        
+        if _log_previews_enabled():
+            self.logger.info(
+                "llm_response",
+                has_tool_calls=bool(getattr(response, "tool_calls", None)),
+                content_preview=_content_text(response.content)[:100] or None
+            )
         
         return {"messages": [response]}
 
     async def _execute_tool(self, state: AgentState) -> Dict[str, Any]:
-        """Execute a tool based on agent decision.
+        """Execute the tool calls requested by the agent.
+        
+        Read-only tool calls from a single LLM turn run concurrently, bounded
+        by MAX_CONCURRENT_TOOL_CALLS. Tools flagged ``serialize`` (resource
+        mutations) run afterwards, one at a time in the order requested.
         
         Args:
             state: Current agent state
@@ -406,47 +494,105 @@ Always prioritize security best practices."""
         last_message = state["messages"][-1]
         
         # Extract tool calls from the last message
-        tool_calls = last_message.tool_calls if hasattr(last_message, 'tool_calls') else []
+        tool_calls = getattr(last_message, "tool_calls", None)
         
         if not tool_calls:
             self.logger.warning("no_tool_calls_found")
             return {"messages": []}
         
-        # Execute each tool call
+        results = await self._run_tool_calls(tool_calls)
+        
         tool_messages = []
-        for tool_call in tool_calls:
+        tool_results = []
+        for tool_call, result in zip(tool_calls, results):
             tool_name = tool_call["name"]
-            tool_input = tool_call["args"]
             
-            self.logger.info("executing_tool", tool=tool_name, input=tool_input)
+            if isinstance(result, BaseException):
+                content = f"Error executing {tool_name}: {str(result)}"
+            else:
+                content = str(result)
+                if _log_previews_enabled():
+                    self.logger.info("tool_result_content", tool=tool_name, content=content[:500])
             
+            tool_results.append(content)
+            tool_messages.append(ToolMessage(
+                content=content,
+                tool_call_id=tool_call["id"],
+                name=tool_name
+            ))
+        
+        return {"messages": tool_messages, "tool_results": tool_results}
+
+    async def _run_tool_calls(self, tool_calls: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Run tool calls, returning results (or exceptions) in request order.
+        
+        Read-only calls run concurrently; mutating tools then run one at a
+        time, in order.
+        
+        Args:
+            tool_calls: Tool calls with "name" and "args" keys
+            
+        Returns:
+            One result or exception per tool call
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+        results: List[Any] = [None] * len(tool_calls)
+        parallel = [i for i, tc in enumerate(tool_calls) if tc["name"] not in self._serial_tools]
+        serial = [i for i, tc in enumerate(tool_calls) if tc["name"] in self._serial_tools]
+        
+        gathered = await asyncio.gather(
+            *(self._invoke_tool(tool_calls[i], semaphore) for i in parallel),
+            return_exceptions=True
+        )
+        for i, result in zip(parallel, gathered):
+            results[i] = result
+        
+        for i in serial:
             try:
-                # Execute tool
-                result = await self.tool_executor.ainvoke(tool_call)
-                
-                self.logger.info("tool_executed", tool=tool_name, success=True)
-                
-                # Create tool message with result
-                tool_message = ToolMessage(
-                    content=str(result),
-                    tool_call_id=tool_call["id"],
-                    name=tool_name
-                )
-                self.logger.info("tool_result_content", tool=tool_name, content=str(result)[:500])
-                tool_messages.append(tool_message)
-                
+                results[i] = await self._invoke_tool(tool_calls[i], semaphore)
             except Exception as e:
-                self.logger.error("tool_execution_failed", tool=tool_name, error=str(e))
-                
-                # Create error message
-                tool_message = ToolMessage(
-                    content=f"Error executing {tool_name}: {str(e)}",
-                    tool_call_id=tool_call["id"],
-                    name=tool_name
-                )
-                tool_messages.append(tool_message)
+                results[i] = e
         
-        return {"messages": tool_messages}
+        return results
+
+    async def _invoke_tool(self, tool_call: Dict[str, Any], semaphore: asyncio.Semaphore) -> Any:
+        """Invoke a single tool call.
+        
+        Args:
+            tool_call: Tool call emitted by the LLM
+            semaphore: Semaphore bounding concurrent tool calls
+            
+        Returns:
+            Tool result
+        """
+        tool_name = tool_call["name"]
+        tool_input = tool_call["args"]
+        
+        tool = self._tools_by_name.get(tool_name)
+        if tool is None:
+            self.logger.error("tool_execution_failed", tool=tool_name, error="unknown tool")
+            raise ValueError(f"Unknown tool: {tool_name}")
+        
+        async with semaphore:
+            self.logger.info("executing_tool", tool=tool_name, input=tool_input)
+            start_time = time.perf_counter()
+            try:
+                result = await tool.ainvoke(tool_input)
+            except Exception as e:
+                self.logger.error(
+                    "tool_execution_failed",
+                    tool=tool_name,
+                    error=str(e),
+                    duration_ms=round((time.perf_counter() - start_time) * 1000, 2)
+                )
+                raise
+            self.logger.info(
+                "tool_executed",
+                tool=tool_name,
+                success=True,
+                duration_ms=round((time.perf_counter() - start_time) * 1000, 2)
+            )
+            return result
 
     def _should_continue(self, state: AgentState) -> str:
         """Determine if agent should continue or end.
@@ -457,16 +603,110 @@ Always prioritize security best practices."""
         Returns:
             Next node name ("continue" to execute tools, "end" to finish)
         """
-        messages = state["messages"]
-        last_message = messages[-1]
+        last_message = state["messages"][-1]
         
         # If last message has tool calls, continue to execute them
-        if hasattr(last_message, 'tool_calls') and last_message.tool_calls:
+        if getattr(last_message, "tool_calls", None):
             return "continue"
         
         # Otherwise, we're done
         return "end"
 
+    async def _run_loop(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the agent/action cycle directly, without LangGraph.
+        
+        Calls the same node functions as the compiled graph and merges their
+        updates the way the graph's reducers do.
+        
+        Args:
+            state: Initial agent state
+            
+        Returns:
+            Final agent state
+            
+        Raises:
+            RuntimeError: If the agent has not finished after settings.max_iterations steps
+        """
+        state = {"messages": list(state["messages"]), "tool_results": list(state["tool_results"])}
+        
+        for _ in range(settings.max_iterations):
+            update = await self._run_agent(state)
+            state["messages"].extend(update["messages"])
+            if self._should_continue(state) == "end":
+                return state
+            
+            update = await self._execute_tool(state)
+            state["messages"].extend(update["messages"])
+            state["tool_results"].extend(update.get("tool_results", []))
+        
+        raise RuntimeError(
+            f"Agent did not finish within {settings.max_iterations} reasoning steps"
+        )
+
+    def _initial_state(self, user_input: str) -> Dict[str, Any]:
+        """Create the initial graph state for a user message.
+        
+        The system message is placed in the state up front so _run_agent can
+        pass the accumulated messages to the LLM without copying them each turn.
+        """
+        return {
+            "messages": [SYSTEM_MESSAGE, HumanMessage(content=user_input)],
+            "tool_results": []
+        }
+
+    def _finalize_response(self, user_input: str, result: Dict[str, Any]) -> str:
+        """Build the final response from a graph run and store it in memory.
+        
+        Args:
+            user_input: User's natural language command
+            result: Final graph state
+            
+        Returns:
+            Agent's response
+        """
+        # Extract final response from the last message
+        response = _content_text(result["messages"][-1].content)
+        
+        # Tool results are collected in the state as tools execute
+        # If the AI response is generic, append the tool data
+        tool_results = result.get("tool_results", [])
+        
+        # If we have tool results and the response is short/generic, include the data
+        if tool_results and len(response) < 300:
+            response += "\n\n" + "\n\n".join(tool_results)
+        
+        self.logger.info("command_executed", response_length=len(response))
+        
+        # Store conversation event in memory (short-term memory) in the background
+        # so the memory service round trip is not on the response path
+        if self.memory_session and response.strip():
+            task = asyncio.create_task(
+                asyncio.to_thread(
+                    self.memory_session.create_event,
+                    user_message=user_input,
+                    assistant_message=response
+                )
+            )
+            _pending_memory_writes.add(task)
+            task.add_done_callback(self._on_memory_write_done)
+        
+        return response
+
+    def _on_memory_write_done(self, task: "asyncio.Task[Any]") -> None:
+        """Log the outcome of a background memory write."""
+        _pending_memory_writes.discard(task)
+        if task.cancelled():
+            return
+        
+        mem_error = task.exception()
+        if mem_error is None:
+            self.logger.info("conversation_stored_in_memory")
+        else:
+            self.logger.warning(
+                "memory_store_failed",
+                error=str(mem_error)
+            )
+
     async def execute(self, user_input: str) -> str:
         """Execute a user command through the agent.
         
@@ -479,54 +719,75 @@ Always prioritize security best practices."""
         try:
             self.logger.info("executing_command", input=user_input)
             
-            # Create initial state with user message
-            initial_state = {
-                "messages": [HumanMessage(content=user_input)]
-            }
-            
-            # Run the Langgraph workflow
-            result = await self.graph.ainvoke(initial_state)
-            
-            # Extract final response from the last message
-            final_message = result["messages"][-1]
-            
-            if isinstance(final_message, AIMessage):
-                response = final_message.content
+            # Run the Langgraph workflow, or the equivalent plain loop
+            if settings.use_langgraph:
+                result = await self.graph.ainvoke(self._initial_state(user_input))
             else:
-                response = str(final_message.content) if hasattr(final_message, "content") else str(final_message)
+                result = await self._run_loop(self._initial_state(user_input))
             
-            # Check if there are tool results in the message history
-            # If the AI response is generic, append the tool data
-            tool_results = []
-            for msg in result["messages"]:
-                if isinstance(msg, ToolMessage):
-                    tool_results.append(msg.content)
+            return self._finalize_response(user_input, result)
             
-            # If we have tool results and the response is short/generic, include the data
-            if tool_results and len(response) < 300:
-                response += "\n\n" + "\n\n".join(tool_results)
+        except Exception as e:
+            self.logger.error("execution_failed", error=str(e), error_type=type(e).__name__)
+            return f"Error executing command: {str(e)}"
+
+    async def stream(self, user_input: str) -> AsyncIterator[str]:
+        """Execute a user command, yielding response text as it is generated.
+        
+        LLM tokens are yielded as they arrive. If tool data is appended to a
+        short final answer (as in execute()), it is yielded last. Streaming
+        always runs through the LangGraph workflow.
+        
+        Args:
+            user_input: User's natural language command
             
-            self.logger.info("command_executed", response_length=len(response))
+        Yields:
+            Chunks of the agent's response
+        """
+        try:
+            self.logger.info("executing_command", input=user_input, streaming=True)
             
-            # Store conversation event in memory (short-term memory)
-            if self.memory_session and response.strip():
-                try:
-                    self.memory_session.create_event(
-                        user_message=user_input,
-                        assistant_message=response
-                    )
-                    self.logger.info("conversation_stored_in_memory")
-                except Exception as mem_error:
-                    self.logger.warning(
-                        "memory_store_failed",
-                        error=str(mem_error)
-                    )
+            result = None
+            async for mode, payload in self.graph.astream(
+                self._initial_state(user_input),
+                stream_mode=["messages", "values"]
+            ):
+                if mode == "values":
+                    result = payload
+                    continue
+                chunk, metadata = payload
+                if metadata.get("langgraph_node") == "agent":
+                    text = _content_text(chunk.content)
+                    if text:
+                        yield text
             
-            return response
+            final_text = _content_text(result["messages"][-1].content)
+            response = self._finalize_response(user_input, result)
+            if len(response) > len(final_text):
+                yield response[len(final_text):]
             
         except Exception as e:
             self.logger.error("execution_failed", error=str(e), error_type=type(e).__name__)
-            return f"Error executing command: {str(e)}"
+            yield f"Error executing command: {str(e)}"
+
+    async def warm_up(self) -> None:
+        """Open the Bedrock connection ahead of the first request.
+        
+        Sends a minimal prompt so credential resolution, SigV4 signing and the
+        TLS handshake happen before a user is waiting. The prompt is a billed
+        model invocation, which is why settings.warm_up_on_start is off by
+        default. Failures are logged and otherwise ignored; the first real
+        request will simply pay the cost.
+        """
+        start = time.perf_counter()
+        try:
+            await self.llm.ainvoke([HumanMessage(content="ping")])
+            self.logger.info(
+                "bedrock_connection_warmed",
+                duration_ms=round((time.perf_counter() - start) * 1000, 2)
+            )
+        except Exception as e:
+            self.logger.warning("bedrock_warm_up_failed", error=str(e))
 
     def new_session(self) -> Optional[str]:
         """Start a new memory session while keeping the same actor.
@@ -577,11 +838,13 @@ Always prioritize security best practices."""
     def execute_sync(self, user_input: str) -> str:
         """Synchronous wrapper for execute.
         
+        Runs on the process-wide background event loop, so repeated calls
+        reuse the same loop and its connection pools.
+        
         Args:
             user_input: User's natural language command
             
         Returns:
             Agent's response
         """
-        import asyncio
-        return asyncio.run(self.execute(user_input))
+        return run_in_background_loop(self.execute(user_input))
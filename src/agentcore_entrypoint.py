@@ -9,12 +9,15 @@ Reference: https://github.com/awslabs/amazon-bedrock-agentcore-samples/tree/main
 """
 
 import asyncio
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, AsyncIterator, Union
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
 import structlog
 
 from agent import AWSResourceAgent
-from utils import setup_logging
+from utils import (
+    setup_logging, get_background_loop, run_in_background_loop, stream_in_background_loop
+)
 from config import settings
 
 # Setup logging for AgentCore runtime
@@ -30,28 +33,41 @@ app = BedrockAgentCoreApp()
 
 # Initialize the agent (singleton pattern for reuse across invocations)
 agent = None
+# Guards agent creation when concurrent invocations arrive during cold start
+_agent_lock = threading.Lock()
 
 
 def get_agent() -> AWSResourceAgent:
     """Get or create the agent instance (singleton pattern).
     
+    Uses double-checked locking so concurrent first invocations build a
+    single agent. When settings.warm_up_on_start is enabled, the Bedrock
+    connection is warmed in the background once the agent exists.
+    
     Returns:
         AWSResourceAgent: The agent instance
     """
     global agent
     if agent is None:
-        logger.info(
-            "initializing_agent",
-            agent_name=settings.agent_name,
-            model=settings.bedrock_model_id,
-            region=settings.bedrock_region
-        )
-        agent = AWSResourceAgent()
+        with _agent_lock:
+            if agent is None:
+                logger.info(
+                    "initializing_agent",
+                    agent_name=settings.agent_name,
+                    model=settings.bedrock_model_id,
+                    region=settings.bedrock_region
+                )
+                agent = AWSResourceAgent()
+                if settings.warm_up_on_start:
+                    # Not awaited: the first invocation can start while this runs
+                    asyncio.run_coroutine_threadsafe(agent.warm_up(), get_background_loop())
     return agent
 
 
 @app.entrypoint
-def agent_invocation(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
+def agent_invocation(
+    payload: Dict[str, Any], context: Any
+) -> Union[Dict[str, Any], AsyncIterator[str]]:
     """
     AgentCore entrypoint for processing requests.
     
@@ -64,12 +80,15 @@ def agent_invocation(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
             - prompt (str): The user's natural language command
             - session_id (str, optional): Session identifier for context
             - parameters (dict, optional): Additional parameters
+            - stream (bool, optional): Stream the response text as server-sent events
         context: The AgentCore context object containing:
             - request_id: Unique request identifier
             - invocation_time: Timestamp of invocation
             - runtime_config: Runtime configuration
     
     Returns:
+        When ``stream`` is set, an async generator of response text chunks
+        (sent by AgentCore as server-sent events). Otherwise a
         dict: Response containing:
             - result (str): The agent's response
             - success (bool): Whether the operation succeeded
@@ -135,8 +154,20 @@ def agent_invocation(payload: Dict[str, Any], context: Any) -> Dict[str, Any]:
         # Set memory session for this invocation (maintains conversation context)
         aws_agent.set_session(session_id=session_id, actor_id=actor_id)
         
-        # Execute agent (using asyncio since our agent is async)
-        result = asyncio.run(aws_agent.execute(prompt))
+        if payload.get("stream"):
+            # Tokens are yielded as the LLM generates them. The agent runs on
+            # the background loop like execute(); the server loop only relays
+            # chunks, so long tool calls cannot delay /ping or other requests
+            return stream_in_background_loop(aws_agent.stream(prompt))
+        
+        # Execute agent on the persistent event loop so async clients and
+        # their connection pools are reused across invocations. Invocations
+        # share the loop, so blocking work (tool boto3 calls, Bedrock reads)
+        # runs on its worker threads
+        result = run_in_background_loop(
+            aws_agent.execute(prompt),
+            timeout=settings.request_timeout
+        )
         
         execution_time = (time.time() - start_time) * 1000  # Convert to ms
         
@@ -13,29 +13,32 @@ Usage:
 import os
 import sys
 import json
-import boto3
-from dotenv import load_dotenv
+
+# Directory of this script and the src directory above it, resolved once
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SRC = os.path.dirname(_HERE)
+
+# Import utils from current directory explicitly to avoid conflicts with the
+# src/utils package. It is registered as "gateway_utils" so both setup scripts
+# (and repeat imports) share one loaded module.
+utils = sys.modules.get("gateway_utils")
+if utils is None:
+    import importlib.util
+    utils_path = os.path.join(_HERE, 'utils.py')
+    spec = importlib.util.spec_from_file_location("gateway_utils", utils_path)
+    utils = importlib.util.module_from_spec(spec)
+    sys.modules["gateway_utils"] = utils
+    spec.loader.exec_module(utils)
 
 # Load environment variables from .env file (check src/.env first, then local)
-src_env = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-local_env = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
-load_dotenv(src_env)
-load_dotenv(local_env, override=True)  # Local overrides if exists
+utils.load_env()
 
 # Add src directory to path for config import (must be first)
-src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from config import settings
 
-# Import utils from current directory explicitly to avoid conflicts
-import importlib.util
-utils_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils.py')
-spec = importlib.util.spec_from_file_location("gateway_utils", utils_path)
-utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(utils)
-
 # Configuration - use settings.aws_region as default
 REGION = os.environ.get('AWS_REGION', os.environ.get('AWS_DEFAULT_REGION', settings.aws_region))
 GATEWAY_NAME = "resource-metrics-ac-gateway"
@@ -49,13 +52,14 @@ SCOPES = [
         "ScopeDescription": "Scope for invoking the agentcore gateway"
     }
 ]
+# Fully qualified scope names, as requested by the M2M client
+SCOPE_NAMES = [f"{RESOURCE_SERVER_ID}/{scope['ScopeName']}" for scope in SCOPES]
+SCOPE_STRING = " ".join(SCOPE_NAMES)
 
 
 def setup_iam_role(config):
     """Step 1: Create IAM Role for AgentCore Gateway."""
-    print("=" * 70)
-    print("Part 1: Create IAM Role for AgentCore Gateway")
-    print("=" * 70)
+    utils.print_banner("Part 1: Create IAM Role for AgentCore Gateway")
     print(f"Region: {REGION}")
     print(f"Gateway Name: {GATEWAY_NAME}")
     
@@ -81,25 +85,26 @@ def setup_iam_role(config):
 
 def setup_cognito(config):
     """Step 2: Configure Cognito for inbound authentication."""
-    print("=" * 70)
-    print("Part 2: Configure Amazon Cognito for Inbound Authentication")
-    print("=" * 70)
+    utils.print_banner("Part 2: Configure Amazon Cognito for Inbound Authentication")
     print(f"User Pool Name: {USER_POOL_NAME}")
     print(f"Resource Server ID: {RESOURCE_SERVER_ID}")
     print(f"Client Name: {CLIENT_NAME}")
     
-    # Build scope names
-    scope_names = [f"{RESOURCE_SERVER_ID}/{scope['ScopeName']}" for scope in SCOPES]
-    scope_string = " ".join(scope_names)
-    
     # Create Cognito client
-    cognito = boto3.client("cognito-idp", region_name=REGION)
+    cognito = utils.get_client("cognito-idp", REGION)
     
     print("Creating or retrieving Cognito resources...")
     
+    # Resources saved by a previous run let the lookups below skip list scans
+    saved_cognito = (utils.load_config() or {}).get("cognito", {})
+    
     # Create/Get User Pool
     print("1. Setting up User Pool...")
-    user_pool_id = utils.get_or_create_user_pool(cognito, USER_POOL_NAME)
+    user_pool_id = utils.get_or_create_user_pool(
+        cognito,
+        USER_POOL_NAME,
+        saved_cognito.get("user_pool_id")
+    )
     print(f"User Pool ID: {user_pool_id}")
     
     # Create/Get Resource Server
@@ -120,7 +125,8 @@ def setup_cognito(config):
         user_pool_id, 
         CLIENT_NAME, 
         RESOURCE_SERVER_ID, 
-        scope_names
+        SCOPE_NAMES,
+        saved_cognito
     )
     print(f"Client ID: {client_id}")
     
@@ -134,24 +140,42 @@ def setup_cognito(config):
         "resource_server_id": RESOURCE_SERVER_ID,
         "client_id": client_id,
         "client_secret": client_secret,
-        "scope_names": scope_names,
-        "scope_string": scope_string,
+        "scope_names": SCOPE_NAMES,
+        "scope_string": SCOPE_STRING,
         "discovery_url": cognito_discovery_url
     }
     
     print("Cognito setup complete!")
     print(f"User Pool ID: {user_pool_id}")
     print(f"Client ID: {client_id}")
-    print(f"Scopes: {scope_string}")
+    print(f"Scopes: {SCOPE_STRING}")
     
     return config
 
 
+def find_existing_gateway(gateway_client):
+    """Look up the existing gateway, preferring the ID saved by a previous run."""
+    saved = (utils.load_config() or {}).get("gateway", {})
+    if saved.get("id"):
+        try:
+            gw = gateway_client.get_gateway(gatewayIdentifier=saved["id"])
+            if gw.get("name") == GATEWAY_NAME:
+                return gw
+        except gateway_client.exceptions.ResourceNotFoundException:
+            pass
+    
+    # No usable saved ID - fall back to searching the gateway list, stopping
+    # at the first page that contains a match
+    paginator = gateway_client.get_paginator('list_gateways')
+    matches = paginator.paginate(PaginationConfig={'PageSize': 50}).search(
+        f"items[?name=='{GATEWAY_NAME}']"
+    )
+    return next(iter(matches), None)
+
+
 def create_gateway(config):
     """Step 3: Create the AgentCore Gateway."""
-    print("=" * 70)
-    print("Part 3: Create AgentCore Gateway")
-    print("=" * 70)
+    utils.print_banner("Part 3: Create AgentCore Gateway")
     print(f"Gateway Name: {GATEWAY_NAME}")
     
     # Get values from config
@@ -164,7 +188,7 @@ def create_gateway(config):
     print(f"Using Discovery URL: {discovery_url}")
     
     # Create Gateway client
-    gateway_client = boto3.client('bedrock-agentcore-control', region_name=REGION)
+    gateway_client = utils.get_client('bedrock-agentcore-control', REGION)
     
     # Build auth configuration
     auth_config = {
@@ -208,24 +232,22 @@ def create_gateway(config):
     except gateway_client.exceptions.ConflictException:
         print("Gateway with this name already exists. Retrieving existing gateway...")
         
-        list_response = gateway_client.list_gateways(maxResults=50)
-        for gw in list_response.get('items', []):
-            if gw['name'] == GATEWAY_NAME:
-                gateway_id = gw['gatewayId']
-                gateway_url = gw['gatewayUrl']
-                print("Found existing gateway!")
-                print(f"Gateway ID: {gateway_id}")
-                print(f"Gateway URL: {gateway_url}")
-                
-                config["gateway"] = {
-                    "id": gateway_id,
-                    "url": gateway_url,
-                    "name": GATEWAY_NAME
-                }
-                break
-        else:
+        gw = find_existing_gateway(gateway_client)
+        if gw is None:
             print("Error: Could not find the existing gateway.")
             return None
+        
+        gateway_id = gw['gatewayId']
+        gateway_url = gw['gatewayUrl']
+        print("Found existing gateway!")
+        print(f"Gateway ID: {gateway_id}")
+        print(f"Gateway URL: {gateway_url}")
+        
+        config["gateway"] = {
+            "id": gateway_id,
+            "url": gateway_url,
+            "name": GATEWAY_NAME
+        }
     
     except Exception as e:
         print(f"Error creating gateway: {e}")
@@ -235,23 +257,21 @@ def create_gateway(config):
 
 
 def main():
-    print("=" * 70)
-    print("AgentCore Gateway Setup - Step 1")
-    print("IAM Role + Cognito + Gateway Creation")
-    print("=" * 70)
+    utils.print_banner("AgentCore Gateway Setup - Step 1", "IAM Role + Cognito + Gateway Creation")
     print(f"Region: {REGION}")
     
-    config = {}
+    # Parts 1 and 2 use disjoint services (IAM and Cognito), so run them
+    # concurrently, each filling its own config dict. Their progress output
+    # is printed part by part once both have finished.
+    iam_config, cognito_config = utils.run_steps_concurrently(
+        lambda: setup_iam_role({}),
+        lambda: setup_cognito({})
+    )
     
-    # Part 1: Create IAM Role
-    config = setup_iam_role(config)
-    if not config:
+    if not iam_config or not cognito_config:
         return None
     
-    # Part 2: Setup Cognito
-    config = setup_cognito(config)
-    if not config:
-        return None
+    config = {**iam_config, **cognito_config}
     
     # Part 3: Create Gateway
     config = create_gateway(config)
@@ -261,9 +281,7 @@ def main():
     # Save configuration
     utils.save_config(config)
     
-    print("=" * 70)
-    print("Step 1 Complete - Gateway Setup Finished!")
-    print("=" * 70)
+    utils.print_banner("Step 1 Complete - Gateway Setup Finished!")
     print(f"Gateway ID: {config['gateway']['id']}")
     print(f"Gateway URL: {config['gateway']['url']}")
     print(f"Cognito User Pool ID: {config['cognito']['user_pool_id']}")
@@ -12,29 +12,33 @@ Usage:
 
 import os
 import sys
-import boto3
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+# Directory of this script and the src directory above it, resolved once
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SRC = os.path.dirname(_HERE)
+
+# Import utils from current directory explicitly to avoid conflicts with the
+# src/utils package. It is registered as "gateway_utils" so both setup scripts
+# (and repeat imports) share one loaded module.
+utils = sys.modules.get("gateway_utils")
+if utils is None:
+    import importlib.util
+    utils_path = os.path.join(_HERE, 'utils.py')
+    spec = importlib.util.spec_from_file_location("gateway_utils", utils_path)
+    utils = importlib.util.module_from_spec(spec)
+    sys.modules["gateway_utils"] = utils
+    spec.loader.exec_module(utils)
 
 # Load environment variables from .env file (check src/.env first, then local)
-src_env = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-local_env = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
-load_dotenv(src_env)
-load_dotenv(local_env, override=True)  # Local overrides if exists
+utils.load_env()
 
 # Add src directory to path for config import (must be first)
-src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
 
 from config import settings
 
-# Import utils from current directory explicitly to avoid conflicts
-import importlib.util
-utils_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils.py')
-spec = importlib.util.spec_from_file_location("gateway_utils", utils_path)
-utils = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(utils)
-
 # Configuration - use settings.aws_region as default
 REGION = os.environ.get('AWS_REGION', os.environ.get('AWS_DEFAULT_REGION', settings.aws_region))
 CREDENTIAL_PROVIDER_NAME = "resource-metrics-api-key-provider"
@@ -46,11 +50,9 @@ API_KEY = os.environ.get('RESOURCE_METRICS_API_KEY', '')
 API_ID = os.environ.get('RESOURCE_METRICS_API_ID', '')
 
 
-def create_credential_provider(config):
+def create_credential_provider(config, gateway_client):
     """Part 1: Create API Key Credential Provider."""
-    print("=" * 70)
-    print("Part 1: Create API Key Credential Provider")
-    print("=" * 70)
+    utils.print_banner("Part 1: Create API Key Credential Provider")
     print(f"Credential Provider Name: {CREDENTIAL_PROVIDER_NAME}")
     
     if not API_KEY:
@@ -60,12 +62,10 @@ def create_credential_provider(config):
     
     print(f"API Key (first 8 chars): {API_KEY[:8]}...")
     
-    bedrock_agent_client = boto3.client('bedrock-agentcore-control', region_name=REGION)
-    
     print("Creating API Key Credential Provider...")
     
     try:
-        credential_provider_response = bedrock_agent_client.create_api_key_credential_provider(
+        credential_provider_response = gateway_client.create_api_key_credential_provider(
             name=CREDENTIAL_PROVIDER_NAME,
             apiKey=API_KEY,
             tags={
@@ -87,14 +87,14 @@ def create_credential_provider(config):
             "secret_arn": secret_arn
         }
         
-    except (bedrock_agent_client.exceptions.ConflictException, 
-            bedrock_agent_client.exceptions.ValidationException) as e:
+    except (gateway_client.exceptions.ConflictException, 
+            gateway_client.exceptions.ValidationException) as e:
         # Handle both ConflictException and ValidationException for existing provider
         if "already exists" in str(e):
             print("Credential Provider already exists. Retrieving existing provider...")
             
             try:
-                get_response = bedrock_agent_client.get_api_key_credential_provider(
+                get_response = gateway_client.get_api_key_credential_provider(
                     name=CREDENTIAL_PROVIDER_NAME
                 )
                 credential_provider_arn = get_response['credentialProviderArn']
@@ -121,11 +121,32 @@ def create_credential_provider(config):
     return config
 
 
+def find_existing_target(gateway_client, gateway_id, target_name, saved_id=None):
+    """Look up an existing gateway target, preferring the ID saved by a previous run."""
+    if saved_id:
+        try:
+            target = gateway_client.get_gateway_target(
+                gatewayIdentifier=gateway_id,
+                targetId=saved_id
+            )
+            if target.get('name') == target_name:
+                return target
+        except gateway_client.exceptions.ResourceNotFoundException:
+            pass
+    
+    # No usable saved ID - fall back to searching the target list, stopping
+    # at the first page that contains a match
+    paginator = gateway_client.get_paginator('list_gateway_targets')
+    matches = paginator.paginate(
+        gatewayIdentifier=gateway_id,
+        PaginationConfig={'PageSize': 50}
+    ).search(f"items[?name=='{target_name}']")
+    return next(iter(matches), None)
+
+
 def create_iam_target(config, gateway_client, gateway_id, api_id):
     """Part 2: Create Gateway Target for IAM-authorized endpoints."""
-    print("=" * 70)
-    print("Part 2: Create Gateway Target - IAM-Authorized Endpoints")
-    print("=" * 70)
+    utils.print_banner("Part 2: Create Gateway Target - IAM-Authorized Endpoints")
     print(f"Target Name: {IAM_TARGET_NAME}")
     print(f"Endpoints: /api/metrics/s3, /api/metrics/dynamodb, /api/metrics/lambda")
     
@@ -202,17 +223,11 @@ def create_iam_target(config, gateway_client, gateway_id, api_id):
         
         target_id = create_gateway_target_response['targetId']
         
+        status = create_gateway_target_response.get('status', 'CREATING')
+        
         print("Gateway Target created successfully!")
         print(f"Target ID: {target_id}")
         
-        print("Waiting for target to be ready...")
-        status = utils.wait_for_gateway_target_ready(gateway_client, gateway_id, target_id)
-        
-        if status == 'READY':
-            print("Target is now READY!")
-        else:
-            print(f"Target status: {status}")
-        
         if "targets" not in config:
             config["targets"] = {}
         
@@ -226,28 +241,24 @@ def create_iam_target(config, gateway_client, gateway_id, api_id):
     except gateway_client.exceptions.ConflictException:
         print(f"Target '{IAM_TARGET_NAME}' already exists.")
         
-        list_response = gateway_client.list_gateway_targets(
-            gatewayIdentifier=gateway_id,
-            maxResults=50
-        )
-        for target in list_response.get('items', []):
-            if target['name'] == IAM_TARGET_NAME:
-                target_id = target['targetId']
-                status = target['status']
-                print("Found existing target!")
-                print(f"Target ID: {target_id}")
-                print(f"Status: {status}")
-                
-                if "targets" not in config:
-                    config["targets"] = {}
-                
-                config["targets"]["iam_target"] = {
-                    "id": target_id,
-                    "name": IAM_TARGET_NAME,
-                    "api_id": api_id,
-                    "status": status
-                }
-                break
+        saved_id = config.get("targets", {}).get("iam_target", {}).get("id")
+        target = find_existing_target(gateway_client, gateway_id, IAM_TARGET_NAME, saved_id)
+        if target is not None:
+            target_id = target['targetId']
+            status = target['status']
+            print("Found existing target!")
+            print(f"Target ID: {target_id}")
+            print(f"Status: {status}")
+            
+            if "targets" not in config:
+                config["targets"] = {}
+            
+            config["targets"]["iam_target"] = {
+                "id": target_id,
+                "name": IAM_TARGET_NAME,
+                "api_id": api_id,
+                "status": status
+            }
     
     except Exception as e:
         print(f"Error creating IAM gateway target: {e}")
@@ -258,9 +269,7 @@ def create_iam_target(config, gateway_client, gateway_id, api_id):
 
 def create_apikey_target(config, gateway_client, gateway_id, api_id):
     """Part 3: Create Gateway Target for API Key-authorized endpoints."""
-    print("=" * 70)
-    print("Part 3: Create Gateway Target - API Key-Authorized Endpoints")
-    print("=" * 70)
+    utils.print_banner("Part 3: Create Gateway Target - API Key-Authorized Endpoints")
     print(f"Target Name: {APIKEY_TARGET_NAME}")
     print(f"Endpoints: /api/metrics/report")
     
@@ -310,17 +319,11 @@ def create_apikey_target(config, gateway_client, gateway_id, api_id):
         
         target_id = create_gateway_target_response['targetId']
         
+        status = create_gateway_target_response.get('status', 'CREATING')
+        
         print("Gateway Target created successfully!")
         print(f"Target ID: {target_id}")
         
-        print("Waiting for target to be ready...")
-        status = utils.wait_for_gateway_target_ready(gateway_client, gateway_id, target_id)
-        
-        if status == 'READY':
-            print("Target is now READY!")
-        else:
-            print(f"Target status: {status}")
-        
         if "targets" not in config:
             config["targets"] = {}
         
@@ -334,28 +337,24 @@ def create_apikey_target(config, gateway_client, gateway_id, api_id):
     except gateway_client.exceptions.ConflictException:
         print(f"Target '{APIKEY_TARGET_NAME}' already exists.")
         
-        list_response = gateway_client.list_gateway_targets(
-            gatewayIdentifier=gateway_id,
-            maxResults=50
-        )
-        for target in list_response.get('items', []):
-            if target['name'] == APIKEY_TARGET_NAME:
-                target_id = target['targetId']
-                status = target['status']
-                print("Found existing target!")
-                print(f"Target ID: {target_id}")
-                print(f"Status: {status}")
-                
-                if "targets" not in config:
-                    config["targets"] = {}
-                
-                config["targets"]["apikey_target"] = {
-                    "id": target_id,
-                    "name": APIKEY_TARGET_NAME,
-                    "api_id": api_id,
-                    "status": status
-                }
-                break
+        saved_id = config.get("targets", {}).get("apikey_target", {}).get("id")
+        target = find_existing_target(gateway_client, gateway_id, APIKEY_TARGET_NAME, saved_id)
+        if target is not None:
+            target_id = target['targetId']
+            status = target['status']
+            print("Found existing target!")
+            print(f"Target ID: {target_id}")
+            print(f"Status: {status}")
+            
+            if "targets" not in config:
+                config["targets"] = {}
+            
+            config["targets"]["apikey_target"] = {
+                "id": target_id,
+                "name": APIKEY_TARGET_NAME,
+                "api_id": api_id,
+                "status": status
+            }
     
     except Exception as e:
         print(f"Error creating API Key gateway target: {e}")
@@ -365,10 +364,7 @@ def create_apikey_target(config, gateway_client, gateway_id, api_id):
 
 
 def main():
-    print("=" * 70)
-    print("AgentCore Gateway Setup - Step 2")
-    print("Credential Provider + Gateway Targets Creation")
-    print("=" * 70)
+    utils.print_banner("AgentCore Gateway Setup - Step 2", "Credential Provider + Gateway Targets Creation")
     print(f"Region: {REGION}")
     
     # Load existing configuration
@@ -392,24 +388,49 @@ def main():
     
     print(f"API Gateway ID: {API_ID}")
     
-    # Create Gateway client
-    gateway_client = boto3.client('bedrock-agentcore-control', region_name=REGION)
+    # Create Gateway client (shared by every part below)
+    gateway_client = utils.get_client('bedrock-agentcore-control', REGION)
     
     # Part 1: Create Credential Provider
-    config = create_credential_provider(config)
+    config = create_credential_provider(config, gateway_client)
     if not config:
         return None
     
-    # Part 2: Create IAM Target
-    config = create_iam_target(config, gateway_client, gateway_id, API_ID)
-    if not config:
-        return None
+    # Parts 2 and 3: Create the IAM and API Key targets concurrently. Each
+    # works on its own copy of the config; target entries are merged after.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(
+                create_target,
+                {**config, "targets": dict(config.get("targets", {}))},
+                gateway_client,
+                gateway_id,
+                API_ID
+            )
+            for create_target in (create_iam_target, create_apikey_target)
+        ]
+        results = [future.result() for future in futures]
     
-    # Part 3: Create API Key Target
-    config = create_apikey_target(config, gateway_client, gateway_id, API_ID)
-    if not config:
+    if not all(results):
         return None
     
+    targets = config.setdefault("targets", {})
+    for result in results:
+        targets.update(result.get("targets", {}))
+    
+    # Wait for all targets that are not ready yet in one polling loop
+    pending = {t["id"]: t for t in targets.values() if t["status"] != 'READY'}
+    if pending:
+        print("Waiting for targets to be ready...")
+        for target_id, status in utils.wait_for_gateway_targets_ready(
+            gateway_client, [(gateway_id, target_id) for target_id in pending]
+        ):
+            pending[target_id]["status"] = status
+            if status == 'READY':
+                print(f"Target {pending[target_id]['name']} is now READY!")
+            else:
+                print(f"Target {pending[target_id]['name']} status: {status}")
+    
     # Save API Gateway info
     config["api_gateway"] = {
         "id": API_ID,
@@ -419,9 +440,7 @@ def main():
     # Save configuration
     utils.save_config(config)
     
-    print("=" * 70)
-    print("Step 2 Complete - All Targets Created!")
-    print("=" * 70)
+    utils.print_banner("Step 2 Complete - All Targets Created!")
     print(f"Credential Provider ARN: {config['credential_provider']['arn']}")
     print(f"IAM Target ID: {config['targets']['iam_target']['id']}")
     print(f"IAM Target Status: {config['targets']['iam_target']['status']}")
@@ -3,41 +3,154 @@ Utility functions for AgentCore Gateway setup.
 Based on AWS AgentCore samples: https://github.com/awslabs/amazon-bedrock-agentcore-samples
 """
 
+import functools
+import io
 import os
-import boto3
+import sys
 import json
+import random
+import threading
 import time
-from boto3.session import Session
-from botocore.exceptions import ClientError
+from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
-def get_or_create_user_pool(cognito, USER_POOL_NAME):
+# .env files read by the setup scripts: src/.env first, then a local override
+_HERE = os.path.dirname(os.path.abspath(__file__))
+LOCAL_ENV = os.path.join(_HERE, '.env')
+SRC_ENV = os.path.join(os.path.dirname(_HERE), '.env')
+
+
+@functools.lru_cache(maxsize=1)
+def load_env():
+    """
+    Load environment variables from the .env files, once per process.
+    
+    src/.env is loaded first; a .env next to this file overrides it if present.
+    """
+    load_dotenv(SRC_ENV)
+    load_dotenv(LOCAL_ENV, override=True)
+
+
+# Client settings shared by every setup client: a larger keep-alive connection
+# pool so repeated control-plane calls reuse TLS sessions, and adaptive retries
+# so Cognito/IAM throttling is absorbed instead of failing the setup run
+BOTO_CONFIG_OPTIONS = {
+    "max_pool_connections": 50,
+    "tcp_keepalive": True,
+    "retries": {"mode": "adaptive", "max_attempts": 10},
+    "connect_timeout": 5,
+    "read_timeout": 30
+}
+
+# One boto3 session per process, with clients cached by (service, region), so
+# credentials and service models are resolved once for all setup steps.
+# boto3/botocore are imported on first use, keeping this module cheap to import.
+_session = None
+_boto_config = None
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Get the shared boto3 session, creating it on first use.
+    
+    :return: boto3 Session
+    """
+    global _session, _boto_config
+    if _session is None:
+        with _clients_lock:
+            if _session is None:
+                from boto3.session import Session
+                from botocore.config import Config
+                
+                _boto_config = Config(**BOTO_CONFIG_OPTIONS)
+                _session = Session()
+    return _session
+
+
+def get_client(service_name, region=None):
+    """
+    Get a boto3 client from the shared session, creating it on first use.
+    
+    :param service_name: AWS service name (e.g. 'cognito-idp')
+    :param region: AWS region (optional, defaults to session region)
+    :return: boto3 client
+    """
+    key = (service_name, region)
+    client = _clients.get(key)
+    if client is None:
+        session = get_session()
+        # Sessions are not thread-safe; create clients under the lock
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = session.client(
+                    service_name, region_name=region, config=_boto_config
+                )
+    return client
+
+
+def _print_user_pool_domain(user_pool):
+    """Print the hosted UI domain of a described user pool, if it has one."""
+    user_pool_id = user_pool.get('Id', '')
+    domain = user_pool.get('Domain')
+    
+    if domain:
+        region = user_pool_id.split('_')[0] if '_' in user_pool_id else 'ap-south-1'
+        domain_url = f"https://{domain}.auth.{region}.amazoncognito.com"
+        print(f"Found domain for user pool {user_pool_id}: {domain} ({domain_url})")
+    else:
+        print(f"No domains found for user pool {user_pool_id}")
+
+
+def get_or_create_user_pool(cognito, USER_POOL_NAME, saved_id=None):
     """
     Get or create a Cognito User Pool.
     
+    A pool ID saved by a previous run is checked with a single describe call;
+    the full pool list is only scanned when there is no saved ID or the pool
+    it names no longer exists.
+    
     :param cognito: Cognito client
     :param USER_POOL_NAME: Name of the user pool
+    :param saved_id: User Pool ID from a previous run, if any
     :return: User Pool ID
     """
-    response = cognito.list_user_pools(MaxResults=60)
-    for pool in response["UserPools"]:
+    if saved_id:
+        try:
+            user_pool = cognito.describe_user_pool(UserPoolId=saved_id)['UserPool']
+            if user_pool.get('Name') == USER_POOL_NAME:
+                _print_user_pool_domain(user_pool)
+                return saved_id
+        except cognito.exceptions.ResourceNotFoundException:
+            pass
+    
+    pools = (
+        pool
+        for page in cognito.get_paginator('list_user_pools').paginate(
+            PaginationConfig={'PageSize': 60}
+        )
+        for pool in page["UserPools"]
+    )
+    for pool in pools:
         if pool["Name"] == USER_POOL_NAME:
-            user_pool_id = pool["Id"]
-            response = cognito.describe_user_pool(UserPoolId=user_pool_id)
-            user_pool = response.get('UserPool', {})
-            domain = user_pool.get('Domain')
-            
-            if domain:
-                region = user_pool_id.split('_')[0] if '_' in user_pool_id else 'ap-south-1'
-                domain_url = f"https://{domain}.auth.{region}.amazoncognito.com"
-                print(f"Found domain for user pool {user_pool_id}: {domain} ({domain_url})")
-            else:
-                print(f"No domains found for user pool {user_pool_id}")
+            response = cognito.describe_user_pool(UserPoolId=pool["Id"])
+            _print_user_pool_domain(response.get('UserPool', {}))
             return pool["Id"]
     
     print('Creating new user pool')
-    created = cognito.create_user_pool(PoolName=USER_POOL_NAME)
+    created = cognito.create_user_pool(
+        PoolName=USER_POOL_NAME,
+        UserPoolTags={'app': 'agentcore-gateway', 'name': USER_POOL_NAME}
+    )
     user_pool_id = created["UserPool"]["Id"]
     user_pool_id_without_underscore_lc = user_pool_id.replace("_", "").lower()
     cognito.create_user_pool_domain(
@@ -76,20 +189,34 @@ def get_or_create_resource_server(cognito, user_pool_id, RESOURCE_SERVER_ID, RES
         return RESOURCE_SERVER_ID
 
 
-def get_or_create_m2m_client(cognito, user_pool_id, CLIENT_NAME, RESOURCE_SERVER_ID, SCOPES=None):
+def get_or_create_m2m_client(cognito, user_pool_id, CLIENT_NAME, RESOURCE_SERVER_ID, SCOPES=None, saved=None):
     """
     Get or create a Machine-to-Machine Cognito client.
     
+    When the existing client is the one saved by a previous run, its saved
+    secret is reused instead of describing the client again.
+    
     :param cognito: Cognito client
     :param user_pool_id: User Pool ID
     :param CLIENT_NAME: Client name
     :param RESOURCE_SERVER_ID: Resource Server ID
     :param SCOPES: List of scopes
+    :param saved: Saved Cognito config with client_id and client_secret, if any
     :return: Tuple of (client_id, client_secret)
     """
-    response = cognito.list_user_pool_clients(UserPoolId=user_pool_id, MaxResults=60)
-    for client in response["UserPoolClients"]:
+    saved = saved or {}
+    clients = (
+        client
+        for page in cognito.get_paginator('list_user_pool_clients').paginate(
+            UserPoolId=user_pool_id,
+            PaginationConfig={'PageSize': 60}
+        )
+        for client in page["UserPoolClients"]
+    )
+    for client in clients:
         if client["ClientName"] == CLIENT_NAME:
+            if client["ClientId"] == saved.get("client_id") and saved.get("client_secret"):
+                return client["ClientId"], saved["client_secret"]
             describe = cognito.describe_user_pool_client(
                 UserPoolId=user_pool_id, 
                 ClientId=client["ClientId"]
@@ -115,10 +242,35 @@ def get_or_create_m2m_client(cognito, user_pool_id, CLIENT_NAME, RESOURCE_SERVER
     return created["UserPoolClient"]["ClientId"], created["UserPoolClient"]["ClientSecret"]
 
 
+# Keep-alive HTTP session for Cognito token and OIDC metadata requests; retries
+# throttled (429) and transient 5xx responses with exponential backoff
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None
+    )
+))
+
+# Token responses by (client_id, scope_string), with their expiry time
+_token_cache = {}
+_token_cache_lock = threading.Lock()
+
+# Refresh tokens this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+
 def get_token(user_pool_id: str, client_id: str, client_secret: str, scope_string: str, region: str) -> dict:
     """
     Get OAuth token from Cognito.
     
+    Successful token responses are cached until shortly before they expire
+    (``expires_in``, default 3600 seconds).
+    
     :param user_pool_id: User Pool ID
     :param client_id: Client ID
     :param client_secret: Client Secret
@@ -126,6 +278,12 @@ def get_token(user_pool_id: str, client_id: str, client_secret: str, scope_strin
     :param region: AWS region
     :return: Token response dictionary
     """
+    key = (client_id, scope_string)
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached and cached[1] - time.time() > TOKEN_EXPIRY_MARGIN:
+        return cached[0]
+    
     try:
         user_pool_id_without_underscore = user_pool_id.replace("_", "").lower()
         url = f"https://{user_pool_id_without_underscore}.auth.{region}.amazoncognito.com/oauth2/token"
@@ -140,16 +298,90 @@ def get_token(user_pool_id: str, client_id: str, client_secret: str, scope_strin
         print(f"Token URL: {url}")
         # Note: In corporate environments with SSL proxies, you may need to set verify=False
         # or provide a custom certificate bundle
-        import os
         verify = os.environ.get('SSL_VERIFY', 'true').lower() != 'false'
-        response = requests.post(url, headers=headers, data=data, verify=verify)
+        response = _http.post(url, headers=headers, data=data, verify=verify)
         response.raise_for_status()
-        return response.json()
+        token = response.json()
+        with _token_cache_lock:
+            _token_cache[key] = (token, time.time() + token.get("expires_in", 3600))
+        return token
 
     except requests.exceptions.RequestException as err:
         return {"error": str(err)}
 
 
+_BAR = "=" * 70 + "\n"
+
+
+def print_banner(*lines):
+    """
+    Print a section banner (title lines between two rules) in a single write.
+    
+    :param lines: Title lines
+    """
+    sys.stdout.write(_BAR + "".join(f"{line}\n" for line in lines) + _BAR)
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    stdout stand-in that sends writes from registered threads to their own buffer.
+    
+    Writes from any other thread go straight through to the real stream.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffers = {}
+    
+    def capture(self):
+        """Start buffering this thread's output and return the buffer."""
+        buffer = self._buffers[threading.get_ident()] = io.StringIO()
+        return buffer
+    
+    def write(self, text):
+        return self._buffers.get(threading.get_ident(), self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+
+def run_steps_concurrently(*steps):
+    """
+    Run independent setup steps on worker threads and return their results in order.
+    
+    Each step's printed output is buffered and written out, in step order,
+    once all steps have finished, so progress messages do not interleave.
+    If a step raises, the output is still written and the first error re-raised.
+    
+    :param steps: Zero-argument callables
+    :return: List of the steps' return values
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    stdout = sys.stdout
+    router = _ThreadOutput(stdout)
+    buffers = [None] * len(steps)
+    
+    def run(index, step):
+        buffers[index] = router.capture()
+        return step()
+    
+    sys.stdout = router
+    try:
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(run, index, step) for index, step in enumerate(steps)]
+        for future in futures:
+            future.exception()
+    finally:
+        sys.stdout = stdout
+        for buffer in buffers:
+            if buffer is not None:
+                stdout.write(buffer.getvalue())
+        stdout.flush()
+    
+    return [future.result() for future in futures]
+
+
 def create_agentcore_gateway_role(gateway_name, region=None):
     """
     Create an IAM Role for AgentCore Gateway.
@@ -158,12 +390,11 @@ def create_agentcore_gateway_role(gateway_name, region=None):
     :param region: AWS region (optional, defaults to boto session region)
     :return: IAM Role details
     """
-    iam_client = boto3.client('iam')
+    iam_client = get_client('iam')
     agentcore_gateway_role_name = f'agentcore-{gateway_name}-role'
-    boto_session = Session()
     # Use provided region, or fall back to session region, or environment variable
-    region = region or boto_session.region_name or os.environ.get('AWS_REGION', 'ap-south-1')
-    account_id = boto3.client("sts").get_caller_identity()["Account"]
+    region = region or get_session().region_name or os.environ.get('AWS_REGION', 'ap-south-1')
+    account_id = get_client("sts").get_caller_identity()["Account"]
     
     role_policy = {
         "Version": "2012-10-17",
@@ -214,8 +445,11 @@ def create_agentcore_gateway_role(gateway_name, region=None):
             RoleName=agentcore_gateway_role_name,
             AssumeRolePolicyDocument=assume_role_policy_document_json
         )
-        # Pause to make sure role is created
-        time.sleep(10)
+        # Wait until the new role is visible instead of sleeping a fixed time
+        iam_client.get_waiter('role_exists').wait(
+            RoleName=agentcore_gateway_role_name,
+            WaiterConfig={'Delay': 1, 'MaxAttempts': 20}
+        )
     except iam_client.exceptions.EntityAlreadyExistsException:
         print("Role already exists -- using existing role")
         agentcore_iam_role = iam_client.get_role(RoleName=agentcore_gateway_role_name)
@@ -223,64 +457,115 @@ def create_agentcore_gateway_role(gateway_name, region=None):
 
     # Attach the role policy
     print(f"Attaching role policy to {agentcore_gateway_role_name}")
-    try:
-        iam_client.put_role_policy(
-            PolicyDocument=role_policy_document,
-            PolicyName="AgentCorePolicy",
-            RoleName=agentcore_gateway_role_name
-        )
-    except Exception as e:
-        print(f"Error attaching policy: {e}")
+    # IAM is eventually consistent; retry briefly if the role is not yet found
+    for attempt in range(5):
+        try:
+            iam_client.put_role_policy(
+                PolicyDocument=role_policy_document,
+                PolicyName="AgentCorePolicy",
+                RoleName=agentcore_gateway_role_name
+            )
+            break
+        except iam_client.exceptions.NoSuchEntityException:
+            time.sleep(2 ** attempt)
+        except Exception as e:
+            print(f"Error attaching policy: {e}")
+            break
+    else:
+        print(f"Error attaching policy: role {agentcore_gateway_role_name} not found")
 
     return agentcore_iam_role
 
 
-def wait_for_gateway_target_ready(gateway_client, gateway_id, target_id, max_wait=120, interval=5):
+def wait_for_gateway_targets_ready(gateway_client, targets, max_wait=120, max_interval=10, base_delay=0.5):
     """
-    Wait for a gateway target to be in READY state.
+    Wait for several gateway targets to reach READY (or FAILED) state.
+    
+    All pending targets are checked in each round; rounds are spaced with
+    exponential backoff (starting at ``base_delay``, growing 1.5x per round)
+    plus jitter, capped at ``max_interval`` seconds.
     
     :param gateway_client: Bedrock AgentCore Control client
-    :param gateway_id: Gateway ID
-    :param target_id: Target ID
-    :param max_wait: Maximum wait time in seconds
-    :param interval: Polling interval in seconds
-    :return: Target status
+    :param targets: Iterable of (gateway_id, target_id) pairs
+    :param max_wait: Maximum total wait time in seconds
+    :param max_interval: Maximum delay between polling rounds in seconds
+    :param base_delay: Delay before the second polling round in seconds
+    :return: Generator of (target_id, status) pairs, yielded as each target settles
     """
-    elapsed = 0
-    while elapsed < max_wait:
-        try:
-            response = gateway_client.get_gateway_target(
-                gatewayIdentifier=gateway_id,
-                targetId=target_id
-            )
+    pending = list(targets)
+    deadline = time.monotonic() + max_wait
+    attempt = 0
+    while pending:
+        still_pending = []
+        for gateway_id, target_id in pending:
+            try:
+                response = gateway_client.get_gateway_target(
+                    gatewayIdentifier=gateway_id,
+                    targetId=target_id
+                )
+            except gateway_client.exceptions.ClientError as e:
+                print(f"  Error checking target {target_id} status: {e}")
+                yield target_id, 'ERROR'
+                continue
+            
             status = response.get('status', 'UNKNOWN')
-            print(f"  Target status: {status}")
+            print(f"  Target {target_id} status: {status}")
             
             if status == 'READY':
-                return status
+                yield target_id, status
             elif status == 'FAILED':
                 print(f"  Target creation failed. Reason: {response.get('statusReason', 'Unknown')}")
-                return status
-            
-            time.sleep(interval)
-            elapsed += interval
-        except ClientError as e:
-            print(f"  Error checking target status: {e}")
-            return 'ERROR'
+                yield target_id, status
+            else:
+                still_pending.append((gateway_id, target_id))
+        
+        pending = still_pending
+        if not pending:
+            return
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"  Timeout waiting for targets to be ready")
+            for _, target_id in pending:
+                yield target_id, 'TIMEOUT'
+            return
+        
+        delay = base_delay * 1.5 ** attempt + random.uniform(0, base_delay / 2)
+        time.sleep(min(max_interval, delay, remaining))
+        attempt += 1
+
+
+def wait_for_gateway_target_ready(gateway_client, gateway_id, target_id, max_wait=120, max_interval=10):
+    """
+    Wait for a gateway target to be in READY state.
     
-    print(f"  Timeout waiting for target to be ready")
-    return 'TIMEOUT'
+    :param gateway_client: Bedrock AgentCore Control client
+    :param gateway_id: Gateway ID
+    :param target_id: Target ID
+    :param max_wait: Maximum wait time in seconds
+    :param max_interval: Maximum polling interval in seconds
+    :return: Target status
+    """
+    for _, status in wait_for_gateway_targets_ready(
+        gateway_client, [(gateway_id, target_id)], max_wait, max_interval
+    ):
+        return status
 
 
-def save_config(config, filename='gateway_config.json'):
+def save_config(config, filename='gateway_config.json', pretty=True):
     """
     Save configuration to a JSON file.
     
     :param config: Configuration dictionary
     :param filename: Output filename
+    :param pretty: Indent the output for human reading (compact if False)
     """
-    with open(filename, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(config, option=orjson.OPT_INDENT_2 if pretty else 0)
+    else:
+        data = json.dumps(config, indent=2 if pretty else None).encode()
+    with open(filename, 'wb') as f:
+        f.write(data)
     print(f"Configuration saved to {filename}")
 
 
@@ -292,8 +577,9 @@ def load_config(filename='gateway_config.json'):
     :return: Configuration dictionary
     """
     try:
-        with open(filename, 'r') as f:
-            return json.load(f)
+        with open(filename, 'rb') as f:
+            data = f.read()
     except FileNotFoundError:
         print(f"Configuration file {filename} not found")
         return None
+    return orjson.loads(data) if orjson is not None else json.loads(data)
@@ -1,15 +1,65 @@
 """AWS Bedrock client wrapper for LLM interactions."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterator, AsyncIterator, BinaryIO
+import asyncio
 import boto3
-import json
+import threading
 from botocore.exceptions import ClientError
 import structlog
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+    _dumps = json.dumps
+    _loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
 from config import settings
+from utils import run_in_background_loop
 
 logger = structlog.get_logger()
 
+# Upper bound on model invocations in flight for one batch call
+MAX_CONCURRENT_INVOCATIONS = 8
+
+# Claude response bodies at least this large (in bytes) are parsed
+# incrementally with ijson; smaller ones are read and decoded in one call
+STREAM_THRESHOLD = 64 * 1024
+
+# bedrock-runtime clients shared by every BedrockClient, keyed by (service, region)
+_client_cache: Dict[Tuple[str, str], Any] = {}
+_client_cache_lock = threading.Lock()
+
+
+def get_cached_client(service_name: str, region: str) -> Any:
+    """Return a process-wide boto3 client for a service and region.
+    
+    boto3 clients are thread-safe, so one instance (and its connection pool)
+    is shared instead of being rebuilt for every BedrockClient.
+    
+    Args:
+        service_name: AWS service name
+        region: AWS region
+        
+    Returns:
+        boto3 client
+    """
+    key = (service_name, region)
+    client = _client_cache.get(key)
+    if client is None:
+        with _client_cache_lock:
+            client = _client_cache.get(key)
+            if client is None:
+                client = _client_cache[key] = boto3.client(service_name, region_name=region)
+    return client
+
 
 class BedrockClient:
     """Client for interacting with AWS Bedrock LLM."""
@@ -27,7 +77,7 @@ class BedrockClient:
         """
         self.model_id = model_id or settings.bedrock_model_id
         self.region = region or settings.bedrock_region
-        self.client = boto3.client('bedrock-runtime', region_name=self.region)
+        self.client = get_cached_client('bedrock-runtime', self.region)
         self.logger = logger.bind(component="bedrock_client")
 
     def invoke_model(
@@ -49,20 +99,7 @@ class BedrockClient:
             Model response
         """
         try:
-            max_tokens = max_tokens or settings.max_tokens
-            temperature = temperature or settings.temperature
-
-            # Prepare request based on model type
-            if "anthropic.claude" in self.model_id:
-                request_body = self._prepare_claude_request(
-                    prompt, max_tokens, temperature, system_prompt
-                )
-            elif "amazon.titan" in self.model_id:
-                request_body = self._prepare_titan_request(
-                    prompt, max_tokens, temperature
-                )
-            else:
-                raise ValueError(f"Unsupported model: {self.model_id}")
+            request_body = self._prepare_request(prompt, max_tokens, temperature, system_prompt)
 
             self.logger.info(
                 "invoking_bedrock_model",
@@ -72,10 +109,15 @@ class BedrockClient:
 
             response = self.client.invoke_model(
                 modelId=self.model_id,
-                body=json.dumps(request_body)
+                body=_dumps(request_body)
             )
 
-            response_body = json.loads(response['body'].read())
+            if ijson is not None and "anthropic.claude" in self.model_id:
+                length = response['ResponseMetadata'].get('HTTPHeaders', {}).get('content-length')
+                if length is None or int(length) >= STREAM_THRESHOLD:
+                    return self._parse_claude_body(response['body'])
+
+            response_body = _loads(response['body'].read())
             
             return self._parse_response(response_body)
 
@@ -86,6 +128,103 @@ class BedrockClient:
             self.logger.error("unexpected_error", error=str(e))
             raise
 
+    def invoke_model_stream(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """Invoke the Bedrock model and yield generated text as it arrives.
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system_prompt: System prompt for context
+            
+        Yields:
+            Chunks of generated text
+        """
+        try:
+            request_body = self._prepare_request(prompt, max_tokens, temperature, system_prompt)
+
+            self.logger.info(
+                "invoking_bedrock_model",
+                model_id=self.model_id,
+                prompt_length=len(prompt),
+                streaming=True
+            )
+
+            response = self.client.invoke_model_with_response_stream(
+                modelId=self.model_id,
+                body=_dumps(request_body)
+            )
+
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if chunk:
+                    text = self._parse_stream_chunk(_loads(chunk['bytes']))
+                    if text:
+                        yield text
+
+        except ClientError as e:
+            self.logger.error("bedrock_invocation_failed", error=str(e))
+            raise
+        except Exception as e:
+            self.logger.error("unexpected_error", error=str(e))
+            raise
+
+    def _prepare_request(
+        self,
+        prompt: str,
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        system_prompt: Optional[str]
+    ) -> Dict[str, Any]:
+        """Prepare the request body for the configured model.
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens (defaults to settings)
+            temperature: Sampling temperature (defaults to settings)
+            system_prompt: System prompt
+            
+        Returns:
+            Request body
+        """
+        max_tokens = max_tokens or settings.max_tokens
+        temperature = temperature or settings.temperature
+
+        if "anthropic.claude" in self.model_id:
+            return self._prepare_claude_request(
+                prompt, max_tokens, temperature, system_prompt
+            )
+        if "amazon.titan" in self.model_id:
+            return self._prepare_titan_request(
+                prompt, max_tokens, temperature
+            )
+        raise ValueError(f"Unsupported model: {self.model_id}")
+
+    def _parse_stream_chunk(self, event: Dict[str, Any]) -> str:
+        """Extract generated text from a streamed response chunk.
+        
+        Args:
+            event: Decoded chunk payload
+            
+        Returns:
+            Text in the chunk (empty for non-text events)
+        """
+        if "anthropic.claude" in self.model_id:
+            if event.get("type") == "content_block_delta":
+                return event.get("delta", {}).get("text", "")
+            return ""
+        
+        if "amazon.titan" in self.model_id:
+            return event.get("outputText", "")
+        
+        return ""
+
     def _prepare_claude_request(
         self,
         prompt: str,
@@ -183,6 +322,43 @@ class BedrockClient:
         
         return {"text": "", "error": "Unknown model type"}
 
+    def _parse_claude_body(self, body: BinaryIO) -> Dict[str, Any]:
+        """Parse a Claude response body incrementally.
+        
+        Used for bodies of at least STREAM_THRESHOLD bytes. Only the fields
+        _parse_response keeps (the first content block's text, the stop
+        reason and the usage object, nested values included) are extracted,
+        so neither the raw bytes nor the full response dict are materialized.
+        
+        Args:
+            body: Response body stream
+            
+        Returns:
+            Parsed response
+        """
+        text = ""
+        stop_reason = None
+        usage = ijson.ObjectBuilder()
+        block = -1
+
+        for prefix, event, value in ijson.parse(body, use_float=True):
+            if prefix == "content.item":
+                if event == "start_map":
+                    block += 1
+            elif prefix == "content.item.text":
+                if block == 0:
+                    text = value
+            elif prefix == "stop_reason":
+                stop_reason = value
+            elif prefix == "usage" or prefix.startswith("usage."):
+                usage.event(event, value)
+
+        return {
+            "text": text,
+            "stop_reason": stop_reason,
+            "usage": getattr(usage, "value", None) or {}
+        }
+
     async def ainvoke_model(
         self,
         prompt: str,
@@ -192,6 +368,9 @@ class BedrockClient:
     ) -> Dict[str, Any]:
         """Async version of invoke_model.
         
+        The blocking boto3 call runs in a worker thread, so concurrent
+        invocations overlap on the network.
+        
         Args:
             prompt: User prompt
             max_tokens: Maximum tokens to generate
@@ -201,6 +380,91 @@ class BedrockClient:
         Returns:
             Model response
         """
-        # For now, just call the sync version
-        # In production, use aioboto3 for true async
-        return self.invoke_model(prompt, max_tokens, temperature, system_prompt)
+        # boto3 is blocking; run the call on a worker thread so the event loop
+        # (and other concurrent invocations) keep running meanwhile
+        return await asyncio.to_thread(
+            self.invoke_model, prompt, max_tokens, temperature, system_prompt
+        )
+
+    async def ainvoke_model_stream(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """Async version of invoke_model_stream.
+        
+        Each read from the blocking event stream runs in a worker thread.
+        
+        Args:
+            prompt: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            system_prompt: System prompt for context
+            
+        Yields:
+            Chunks of generated text
+        """
+        stream = self.invoke_model_stream(prompt, max_tokens, temperature, system_prompt)
+        done = object()
+        while True:
+            text = await asyncio.to_thread(next, stream, done)
+            if text is done:
+                break
+            yield text
+
+    async def abatch_invoke_model(
+        self,
+        prompts: List[str],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_INVOCATIONS
+    ) -> List[Dict[str, Any]]:
+        """Invoke the model for several independent prompts concurrently.
+        
+        At most ``max_concurrency`` invocations are in flight at once, so the
+        batch pays roughly one round trip per wave instead of one per prompt.
+        
+        Args:
+            prompts: User prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature
+            system_prompt: System prompt shared by every prompt
+            max_concurrency: Maximum concurrent invocations
+            
+        Returns:
+            Model responses, in the same order as ``prompts``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def invoke(prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.ainvoke_model(prompt, max_tokens, temperature, system_prompt)
+
+        return list(await asyncio.gather(*(invoke(prompt) for prompt in prompts)))
+
+    def batch_invoke_model(
+        self,
+        prompts: List[str],
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = MAX_CONCURRENT_INVOCATIONS
+    ) -> List[Dict[str, Any]]:
+        """Synchronous version of abatch_invoke_model.
+        
+        Args:
+            prompts: User prompts
+            max_tokens: Maximum tokens to generate per prompt
+            temperature: Sampling temperature
+            system_prompt: System prompt shared by every prompt
+            max_concurrency: Maximum concurrent invocations
+            
+        Returns:
+            Model responses, in the same order as ``prompts``
+        """
+        return run_in_background_loop(
+            self.abatch_invoke_model(prompts, max_tokens, temperature, system_prompt, max_concurrency)
+        )
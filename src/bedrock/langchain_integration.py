@@ -1,7 +1,11 @@
 """Langchain integration for Bedrock."""
 
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
 from langchain_aws import ChatBedrock
+from langchain_aws.function_calling import convert_to_anthropic_tool
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 from config import settings
@@ -14,6 +18,9 @@ def create_bedrock_llm(
 ) -> ChatBedrock:
     """Create a Langchain ChatBedrock instance with tool calling support.
     
+    Instances (and their bedrock-runtime clients) are cached per resolved
+    configuration, so repeated calls reuse the same client.
+    
     Args:
         model_id: Bedrock model ID
         temperature: Sampling temperature
@@ -22,23 +29,88 @@ def create_bedrock_llm(
     Returns:
         ChatBedrock instance
     """
+    return _cached_bedrock_llm(
+        model_id or settings.bedrock_model_id,
+        settings.bedrock_region,
+        temperature or settings.temperature,
+        max_tokens or settings.max_tokens
+    )
+
+
+@lru_cache(maxsize=8)
+def _cached_bedrock_llm(
+    model_id: str,
+    region: str,
+    temperature: float,
+    max_tokens: int
+) -> ChatBedrock:
+    """Build a ChatBedrock instance for a fully resolved configuration."""
     return ChatBedrock(
-        model_id=model_id or settings.bedrock_model_id,
-        region_name=settings.bedrock_region,
+        model_id=model_id,
+        region_name=region,
         model_kwargs={
-            "temperature": temperature or settings.temperature,
-            "max_tokens": max_tokens or settings.max_tokens,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
         }
     )
 
 
-def create_agent_prompt() -> ChatPromptTemplate:
-    """Create the prompt template for the AWS resource management agent.
+# Schema keywords whose values map names to subschemas (not schemas themselves)
+_SCHEMA_MAPPING_KEYS = frozenset({"properties", "$defs", "definitions"})
+
+
+def _strip_schema_titles(schema: Any) -> Any:
+    """Drop the ``title`` annotations Pydantic adds to every JSON schema node.
+    
+    Titles repeat the field/model names and are sent to the model on every
+    request; names and descriptions are kept.
+    """
+    if isinstance(schema, list):
+        return [_strip_schema_titles(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    
+    stripped = {}
+    for key, value in schema.items():
+        if key == "title" and isinstance(value, str):
+            continue
+        if key in _SCHEMA_MAPPING_KEYS and isinstance(value, dict):
+            stripped[key] = {name: _strip_schema_titles(sub) for name, sub in value.items()}
+        else:
+            stripped[key] = _strip_schema_titles(value)
+    return stripped
+
+
+def bind_agent_tools(llm: ChatBedrock, tools: Sequence[BaseTool]) -> Runnable:
+    """Bind tools to the LLM, converting their schemas to Bedrock format once.
+    
+    For Anthropic models the tool definitions are converted up front with
+    schema titles stripped, and with ``settings.bedrock_prompt_caching`` the
+    last one is marked as a prompt-cache breakpoint so Bedrock can reuse the
+    tool block across turns.
     
+    Args:
+        llm: ChatBedrock instance
+        tools: Tools to expose to the model
+        
     Returns:
-        Chat prompt template
+        LLM runnable with tools bound
     """
-    system_message = """You are an AI assistant specialized in managing AWS resources. 
+    if "anthropic" not in (llm.model_id or ""):
+        return llm.bind_tools(tools)
+    
+    tool_definitions: List[Dict[str, Any]] = []
+    for t in tools:
+        definition = dict(convert_to_anthropic_tool(t))
+        definition["input_schema"] = _strip_schema_titles(definition["input_schema"])
+        tool_definitions.append(definition)
+    if settings.bedrock_prompt_caching and tool_definitions:
+        tool_definitions[-1]["cache_control"] = {"type": "ephemeral"}
+    return llm.bind_tools(tool_definitions)
+
+
+# System prompt for the agent prompt template
+AGENT_SYSTEM_PROMPT = """You are an AI assistant specialized in managing AWS resources. 
 You can help users create, configure, manage, and monitor AWS resources including S3 buckets, 
 Lambda functions, and DynamoDB tables.
 
@@ -76,8 +148,18 @@ Never respond with "I've listed the resources" - ALWAYS show the actual resource
 Always prioritize security best practices and ask for confirmation before destructive operations.
 """
 
+
+@lru_cache(maxsize=1)
+def create_agent_prompt() -> ChatPromptTemplate:
+    """Create the prompt template for the AWS resource management agent.
+    
+    The template is built once and shared by every caller.
+    
+    Returns:
+        Chat prompt template
+    """
     prompt = ChatPromptTemplate.from_messages([
-        ("system", system_message),
+        ("system", AGENT_SYSTEM_PROMPT),
         MessagesPlaceholder(variable_name="chat_history", optional=True),
         ("human", "{input}"),
         MessagesPlaceholder(variable_name="agent_scratchpad"),
@@ -1,6 +1,7 @@
 """Configuration settings for AWS Resource Manager."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,11 +17,15 @@ class Settings(BaseSettings):
     bedrock_region: str = "ap-south-1"
     max_tokens: int = 4096
     temperature: float = 0.7
+    bedrock_prompt_caching: bool = False  # Cache tool definitions (models with prompt caching only)
 
     # Agent Configuration
     agent_name: str = "aws-resource-manager"
     agent_description: str = "AI-powered AWS resource management agent"
     max_iterations: int = 10
+    request_timeout: float = 300.0  # Seconds an AgentCore invocation may run
+    use_langgraph: bool = True  # False runs the agent/tool cycle as a plain loop
+    warm_up_on_start: bool = False  # Send a (billed) warm-up prompt when the runtime agent is created
     verbose: bool = True
 
     # MCP Configuration
@@ -55,5 +60,26 @@ class Settings(BaseSettings):
     )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the application settings, reading the environment on first use.
+    
+    Call ``get_settings.cache_clear()`` to re-read the environment.
+    """
+    return Settings()
+
+
+class _LazySettings:
+    """Proxy for the global settings that defers loading until first access."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_settings())
+
+
+# Global settings instance (loaded on first attribute access)
+settings = _LazySettings()
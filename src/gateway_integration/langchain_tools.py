@@ -2,43 +2,75 @@
 LangChain Tool Wrappers for AgentCore Gateway MCP Tools.
 """
 
-import json
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Type
 from langchain_core.tools import BaseTool, ToolException
 from pydantic import BaseModel, Field, create_model
 
+from utils import format_tool_output
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+    _loads = json.loads
+
+    def _dumps_sorted(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode()
+
 from .mcp_client import MCPGatewayClient, MCPTool
 
 
+# JSON Schema type -> Python type for generated argument fields
+_TYPE_MAPPING = MappingProxyType({
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict
+})
+
+
+class EmptyArgs(BaseModel):
+    """Arguments model shared by all gateway tools that take no parameters."""
+
+
 def json_schema_to_pydantic(schema: Dict[str, Any], model_name: str) -> Type[BaseModel]:
-    """Convert JSON Schema to Pydantic model."""
+    """Convert JSON Schema to Pydantic model.
+    
+    Models are cached by name and (canonicalised) schema, so re-creating
+    tools for the same gateway reuses the already-built classes.
+    """
+    if not schema.get("properties"):
+        return EmptyArgs
+    return _build_model(model_name, _dumps_sorted(schema))
+
+
+@lru_cache(maxsize=256)
+def _build_model(model_name: str, schema_key: bytes) -> Type[BaseModel]:
+    """Build the Pydantic model for a serialized JSON Schema."""
+    schema = _loads(schema_key)
     properties = schema.get("properties", {})
-    required = schema.get("required", [])
+    required = frozenset(schema.get("required", ()))
     
     fields = {}
     for prop_name, prop_schema in properties.items():
         prop_type = prop_schema.get("type", "string")
         description = prop_schema.get("description", "")
         
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "number": float,
-            "boolean": bool,
-            "array": list,
-            "object": dict
-        }
-        
-        python_type = type_mapping.get(prop_type, str)
+        python_type = _TYPE_MAPPING.get(prop_type, str)
         
         if prop_name in required:
             fields[prop_name] = (python_type, Field(description=description))
         else:
             fields[prop_name] = (Optional[python_type], Field(default=None, description=description))
     
-    if not fields:
-        fields["dummy"] = (Optional[str], Field(default=None, description="Placeholder"))
-    
     return create_model(model_name, **fields)
 
 
@@ -54,25 +86,32 @@ class GatewayTool(BaseTool):
     class Config:
         arbitrary_types_allowed = True
     
+    def _arguments(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Drop unset optional arguments before sending them to the gateway."""
+        if self.args_schema is EmptyArgs:
+            return {}
+        return {k: v for k, v in kwargs.items() if v is not None}
+    
     def _run(self, **kwargs) -> str:
         """Execute the tool synchronously."""
         try:
-            arguments = {k: v for k, v in kwargs.items() if v is not None and k != "dummy"}
-            result = self.mcp_client.call_tool(self.mcp_tool_name, arguments)
-            if isinstance(result, dict):
-                return json.dumps(result, indent=2)
-            return str(result)
+            result = self.mcp_client.call_tool(self.mcp_tool_name, self._arguments(kwargs))
+            return format_tool_output(result)
         except Exception as e:
             raise ToolException(f"Error calling gateway tool '{self.mcp_tool_name}': {str(e)}")
     
     async def _arun(self, **kwargs) -> str:
         """Execute the tool asynchronously."""
-        return self._run(**kwargs)
+        try:
+            result = await self.mcp_client.acall_tool(self.mcp_tool_name, self._arguments(kwargs))
+            return format_tool_output(result)
+        except Exception as e:
+            raise ToolException(f"Error calling gateway tool '{self.mcp_tool_name}': {str(e)}")
 
 
 def create_gateway_tools(mcp_client: MCPGatewayClient) -> List[BaseTool]:
     """Create LangChain tools from MCP Gateway tools."""
-    if not mcp_client.initialize():
+    if not mcp_client.bootstrap():
         raise Exception("Failed to initialize MCP connection")
     
     mcp_tools = mcp_client.list_tools()
@@ -2,18 +2,123 @@
 MCP Client for AgentCore Gateway.
 """
 
+import asyncio
 import os
-import json
 import base64
+import hashlib
+import itertools
+import tempfile
+import threading
+import time
+import weakref
+import httpx
 import requests
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import asdict, dataclass
+from pydantic import BaseModel
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    import json
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - h2 is optional
+    _HTTP2 = False
 
 # SSL verification setting (for corporate environments with SSL proxies)
 SSL_VERIFY = os.environ.get('SSL_VERIFY', 'true').lower() != 'false'
 
+# Retry throttled (429) and transient 5xx responses from Cognito and the gateway
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"})
+)
+
+# tools/call responses at least this large (or of unknown length) are
+# stream-parsed with ijson rather than buffered whole
+STREAM_THRESHOLD = 64 * 1024
+
+# Connection limits for the async gateway client
+_ASYNC_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+# Refresh access tokens this many seconds before Cognito says they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+# Proactively fetch a new token this many seconds before the current one expires
+TOKEN_REFRESH_LEAD = 300
+
+# Directory and lifetime of the on-disk tools/list cache
+TOOLS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "agentcore")
+TOOLS_CACHE_TTL = 3600
+
+
+# Parameters of the MCP initialize request
+_INITIALIZE_PARAMS = {
+    "protocolVersion": "2025-03-26",
+    "capabilities": {},
+    "clientInfo": {
+        "name": "aws-resource-manager-agent",
+        "version": "1.0.0"
+    }
+}
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str) -> Dict[str, Any]:
+    """Read and parse a gateway configuration file once per process."""
+    with open(config_path, "rb") as f:
+        return _loads(f.read())
+
 
-@dataclass
+class _MCPContent(BaseModel):
+    """A content block of a tools/call result."""
+    text: Optional[str] = ""
+
+
+class _MCPCallResult(BaseModel):
+    content: List[_MCPContent] = []
+
+
+class _MCPCallResponse(BaseModel):
+    """Shape of a tools/call JSON-RPC response (other fields are ignored)."""
+    result: Optional[_MCPCallResult] = None
+
+
+class _MCPToolDefinition(BaseModel):
+    name: str
+    description: Optional[str] = ""
+    inputSchema: Dict[str, Any] = {}
+
+
+class _MCPToolsListResult(BaseModel):
+    tools: List[_MCPToolDefinition]
+
+
+class _MCPToolsListResponse(BaseModel):
+    """Shape of a tools/list JSON-RPC response (other fields are ignored)."""
+    result: Optional[_MCPToolsListResult] = None
+
+
+@dataclass(slots=True, frozen=True)
 class MCPTool:
     """Represents an MCP tool from the gateway."""
     name: str
@@ -30,124 +135,405 @@ class MCPGatewayClient:
         cognito_token_url: str,
         client_id: str,
         client_secret: str,
-        scope: str
+        scope: str,
+        tools_cache_path: Optional[str] = None
     ):
         self.gateway_url = gateway_url
         self.cognito_token_url = cognito_token_url
         self.client_id = client_id
         self.client_secret = client_secret
         self.scope = scope
-        self._access_token: Optional[str] = None
-        self._tools: List[MCPTool] = []
-    
-    def _get_access_token(self) -> str:
-        """Get OAuth2 access token from Cognito."""
-        if self._access_token:
-            return self._access_token
+        self.tools_cache_path = tools_cache_path
         
-        credentials = base64.b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode()
-        
-        headers = {
+        # The token request never changes for a client, so build it once
+        credentials = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._token_headers = {
             "Content-Type": "application/x-www-form-urlencoded",
             "Authorization": f"Basic {credentials}"
         }
-        
-        data = {
+        self._token_data = {
             "grant_type": "client_credentials",
-            "scope": self.scope
+            "scope": scope
         }
         
-        response = requests.post(
+        self._access_token: Optional[str] = None
+        self._bearer_headers: Optional[Tuple[str, Dict[str, str]]] = None
+        self._request_ids = itertools.count(1)
+        self._token_expiry = 0.0
+        self._token_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._closed = False
+        self._tools: Tuple[MCPTool, ...] = ()
+        
+        # Keep-alive session shared by token and MCP requests, so repeated
+        # calls reuse pooled TLS connections to Cognito and the gateway
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=_RETRY
+        ))
+        
+        # Async clients for tool calls made from an event loop, one per loop:
+        # httpx connections are bound to the loop that opened them, and the
+        # entrypoint uses more than one loop
+        self._async_clients: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    
+    def close(self) -> None:
+        """Stop background token refreshes and close the pooled HTTP connections."""
+        with self._token_lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections, including the async clients'.
+        
+        The running loop's client is closed here; clients opened on other,
+        still running loops are closed on their own loop.
+        """
+        self.close()
+        loop = asyncio.get_running_loop()
+        clients, self._async_clients = self._async_clients, weakref.WeakKeyDictionary()
+        for client_loop, client in list(clients.items()):
+            if client_loop is loop:
+                await client.aclose()
+            elif client_loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the async client for the running event loop, creating it once per loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                verify=SSL_VERIFY,
+                http2=_HTTP2,
+                timeout=30,
+                limits=_ASYNC_LIMITS
+            )
+        return client
+    
+    def __enter__(self) -> "MCPGatewayClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _get_access_token(self) -> str:
+        """Get OAuth2 access token from Cognito.
+        
+        The token is cached until shortly before its ``expires_in`` lifetime
+        runs out; concurrent callers share a single refresh.
+        """
+        token = self._access_token
+        if token and time.monotonic() < self._token_expiry:
+            return token
+        
+        with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expiry:
+                return self._access_token
+            return self._fetch_access_token()
+    
+    def _fetch_access_token(self) -> str:
+        """Request a new access token from Cognito and cache it.
+        
+        Must be called with ``_token_lock`` held. A background refresh is
+        scheduled ahead of expiry, so callers normally never wait on Cognito
+        once the first token has been fetched.
+        """
+        response = self._session.post(
             self.cognito_token_url,
-            headers=headers,
-            data=data,
+            headers=self._token_headers,
+            data=self._token_data,
             verify=SSL_VERIFY
         )
         response.raise_for_status()
         
-        self._access_token = response.json()["access_token"]
+        token_response = _loads(response.content)
+        expires_in = token_response.get("expires_in", 3600)
+        self._token_expiry = time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN
+        self._access_token = token_response["access_token"]
+        self._schedule_token_refresh(max(expires_in - TOKEN_REFRESH_LEAD, expires_in / 2))
         return self._access_token
     
-    def _make_mcp_request(self, method: str, params: Optional[Dict] = None) -> Dict:
-        """Make an MCP JSON-RPC request to the gateway."""
-        token = self._get_access_token()
-        
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json, text/event-stream"
-        }
+    def _schedule_token_refresh(self, delay: float) -> None:
+        """(Re)arm the background token refresh. Called with ``_token_lock`` held."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        if self._closed:
+            return
+        self._refresh_timer = threading.Timer(delay, self._refresh_access_token)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+    
+    def _refresh_access_token(self) -> None:
+        """Fetch a new token in the background before the current one expires."""
+        with self._token_lock:
+            if self._closed:
+                return
+            try:
+                self._fetch_access_token()
+            except Exception as e:
+                # The next call falls back to fetching the token on demand
+                print(f"Background token refresh failed: {e}")
+    
+    def _invalidate_access_token(self, token: str) -> None:
+        """Drop a rejected token, unless another caller already replaced it."""
+        with self._token_lock:
+            if self._access_token == token:
+                self._access_token = None
+                self._token_expiry = 0.0
+    
+    async def _aget_access_token(self) -> str:
+        """Async version of _get_access_token.
         
+        Cached tokens are returned directly; a refresh runs in a worker thread.
+        """
+        token = self._access_token
+        if token and time.monotonic() < self._token_expiry:
+            return token
+        return await asyncio.to_thread(self._get_access_token)
+    
+    def _mcp_payload(self, method: str, params: Optional[Dict]) -> Dict[str, Any]:
+        """Build an MCP JSON-RPC request body with the next request id."""
         payload = {
             "jsonrpc": "2.0",
-            "id": 1,
+            "id": next(self._request_ids),
             "method": method
         }
         if params:
             payload["params"] = params
+        return payload
+    
+    def _mcp_headers(self, token: str) -> Dict[str, str]:
+        """Return the headers for an MCP request, rebuilt only when the token changes."""
+        cached = self._bearer_headers
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/json, text/event-stream"
+        }
+        self._bearer_headers = (token, headers)
+        return headers
+    
+    def _make_mcp_request(self, method: str, params: Optional[Dict] = None) -> Dict:
+        """Make an MCP JSON-RPC request to the gateway."""
+        return self._post(self._mcp_payload(method, params))
+    
+    async def _amake_mcp_request(self, method: str, params: Optional[Dict] = None) -> Dict:
+        """Async version of _make_mcp_request, on the pooled httpx client."""
+        return await self._apost(self._mcp_payload(method, params))
+    
+    def _post(self, payload: Any) -> Any:
+        """POST a JSON-RPC request to the gateway and decode the reply."""
+        return _loads(self._send(payload).content)
+    
+    def _send(self, payload: Any, stream: bool = False) -> requests.Response:
+        """POST a JSON-RPC request to the gateway.
+        
+        A 401 response drops the cached token and retries once with a fresh
+        one, so rotated or revoked tokens recover on their own.
+        """
+        for attempt in range(2):
+            token = self._get_access_token()
+            response = self._session.post(
+                self.gateway_url,
+                headers=self._mcp_headers(token),
+                data=_dumps(payload),
+                verify=SSL_VERIFY,
+                stream=stream
+            )
+            if response.status_code != 401 or attempt:
+                break
+            response.close()
+            self._invalidate_access_token(token)
         
-        response = requests.post(
-            self.gateway_url,
-            headers=headers,
-            json=payload,
-            verify=SSL_VERIFY
-        )
         response.raise_for_status()
         
-        return response.json()
+        return response
+    
+    async def _apost(self, payload: Any) -> Any:
+        """Async version of _post."""
+        client = self._get_async_client()
+        
+        for attempt in range(2):
+            token = await self._aget_access_token()
+            response = await client.post(
+                self.gateway_url,
+                headers=self._mcp_headers(token),
+                content=_dumps(payload)
+            )
+            if response.status_code != 401 or attempt:
+                break
+            self._invalidate_access_token(token)
+        
+        response.raise_for_status()
+        
+        return _loads(response.content)
     
     def initialize(self) -> bool:
         """Initialize the MCP connection."""
         try:
-            result = self._make_mcp_request("initialize", {
-                "protocolVersion": "2025-03-26",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "aws-resource-manager-agent",
-                    "version": "1.0.0"
-                }
-            })
+            result = self._make_mcp_request("initialize", _INITIALIZE_PARAMS)
             return "result" in result
         except Exception as e:
             print(f"Failed to initialize MCP connection: {e}")
             return False
     
-    def list_tools(self) -> List[MCPTool]:
-        """List available tools from the gateway."""
+    def bootstrap(self) -> bool:
+        """Initialize the MCP connection, then load the tool list.
+        
+        ``initialize`` is always sent on its own (MCP does not allow it in a
+        JSON-RPC batch) and ``tools/list`` follows once it has succeeded.
+        When the tool list is cached in memory or on disk, initialize is the
+        only request sent. A failed tools/list is reported; list_tools()
+        retries it.
+        
+        Returns:
+            True if the connection was initialized
+        """
+        if not self.initialize():
+            return False
+        
+        try:
+            self.list_tools()
+        except Exception as e:
+            print(f"Failed to list MCP tools: {e}")
+        return True
+    
+    def list_tools(self) -> Tuple[MCPTool, ...]:
+        """List available tools from the gateway.
+        
+        Results are memoized in-process and, when ``tools_cache_path`` is
+        set, on disk for ``TOOLS_CACHE_TTL`` seconds.
+        """
         if self._tools:
             return self._tools
         
-        result = self._make_mcp_request("tools/list")
-        
-        if "result" in result and "tools" in result["result"]:
-            self._tools = [
-                MCPTool(
-                    name=tool["name"],
-                    description=tool.get("description", ""),
-                    input_schema=tool.get("inputSchema", {})
-                )
-                for tool in result["result"]["tools"]
-            ]
+        self._tools = self._read_tools_cache()
+        if self._tools:
+            return self._tools
         
+        return self.refresh_tools()
+    
+    def refresh_tools(self) -> Tuple[MCPTool, ...]:
+        """Fetch the tool list from the gateway, bypassing any cached copy."""
+        self._set_tools(self._make_mcp_request("tools/list"))
         return self._tools
     
+    def _set_tools(self, result: Dict[str, Any]) -> bool:
+        """Store (and cache) the tools from a tools/list response, if it has any."""
+        if not (isinstance(result.get("result"), dict) and "tools" in result["result"]):
+            return False
+        
+        parsed = _MCPToolsListResponse.model_validate(result)
+        self._tools = tuple(
+            MCPTool(
+                name=tool.name,
+                description=tool.description,
+                input_schema=tool.inputSchema
+            )
+            for tool in parsed.result.tools
+        )
+        self._write_tools_cache()
+        return True
+    
+    def _read_tools_cache(self) -> Tuple[MCPTool, ...]:
+        """Load the cached tool list, or return () if it is missing or stale."""
+        if not self.tools_cache_path:
+            return ()
+        try:
+            if time.time() - os.path.getmtime(self.tools_cache_path) > TOOLS_CACHE_TTL:
+                return ()
+            with open(self.tools_cache_path, "rb") as f:
+                return tuple(MCPTool(**tool) for tool in _loads(f.read()))
+        except (OSError, ValueError, TypeError):
+            return ()
+    
+    def _write_tools_cache(self) -> None:
+        """Atomically replace the on-disk tool list cache."""
+        if not self.tools_cache_path:
+            return
+        try:
+            cache_dir = os.path.dirname(self.tools_cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dumps([asdict(tool) for tool in self._tools]))
+            os.replace(tmp_path, self.tools_cache_path)
+        except OSError as e:
+            print(f"Failed to write tools cache: {e}")
+    
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
-        """Call a tool on the gateway."""
-        result = self._make_mcp_request("tools/call", {
+        """Call a tool on the gateway.
+        
+        Large responses are stream-parsed when ijson is installed, so the raw
+        body is never buffered alongside the decoded result.
+        """
+        payload = self._mcp_payload("tools/call", {
             "name": tool_name,
             "arguments": arguments
         })
+        if ijson is None:
+            return self._parse_tool_result(self._post(payload))
+        
+        with self._send(payload, stream=True) as response:
+            length = response.headers.get("Content-Length")
+            if length is not None and int(length) < STREAM_THRESHOLD:
+                return self._parse_tool_result(_loads(response.content))
+            response.raw.decode_content = True
+            return self._parse_tool_result(self._stream_tool_response(response.raw))
+    
+    async def acall_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool on the gateway without blocking the event loop."""
+        return self._parse_tool_result(await self._amake_mcp_request("tools/call", {
+            "name": tool_name,
+            "arguments": arguments
+        }))
+    
+    @staticmethod
+    def _stream_tool_response(body: Any) -> Dict[str, Any]:
+        """Incrementally decode a tools/call response.
+        
+        The envelope is rebuilt from parse events, but the first content
+        block's text (the bulk of the payload) is captured directly instead
+        of being copied into the envelope as it is parsed.
+        """
+        builder = ijson.ObjectBuilder()
+        text = None
+        block = -1
+        for prefix, event, value in ijson.parse(body, use_float=True):
+            if prefix == "result.content.item" and event == "start_map":
+                block += 1
+            elif prefix == "result.content.item.text" and block == 0:
+                text, value = value, ""
+            builder.event(event, value)
+        
+        envelope = builder.value
+        if text is not None:
+            envelope["result"]["content"][0]["text"] = text
+        return envelope
+    
+    @staticmethod
+    def _parse_tool_result(result: Dict[str, Any]) -> Any:
+        """Extract the payload of a tools/call response."""
+        if "result" not in result:
+            if "error" in result:
+                raise Exception(f"Tool call failed: {result['error']}")
+            return result
         
-        if "result" in result:
-            content = result["result"].get("content", [])
-            if content and len(content) > 0:
-                text_content = content[0].get("text", "")
-                try:
-                    return json.loads(text_content)
-                except json.JSONDecodeError:
-                    return text_content
+        parsed = _MCPCallResponse.model_validate(result)
+        if parsed.result is not None and parsed.result.content:
+            text_content = parsed.result.content[0].text or ""
+            try:
+                return _loads(text_content)
+            except ValueError:
+                return text_content
         
         if "error" in result:
             raise Exception(f"Tool call failed: {result['error']}")
@@ -157,8 +543,7 @@ class MCPGatewayClient:
     @classmethod
     def from_config(cls, config_path: str) -> "MCPGatewayClient":
         """Create client from saved gateway configuration."""
-        with open(config_path, "r") as f:
-            config = json.load(f)
+        config = _read_config(os.path.abspath(config_path))
         
         gateway_url = config["gateway"]["url"]
         cognito = config["cognito"]
@@ -174,5 +559,9 @@ class MCPGatewayClient:
             cognito_token_url=f"https://{domain}.auth.{region}.amazoncognito.com/oauth2/token",
             client_id=cognito["client_id"],
             client_secret=cognito["client_secret"],
-            scope=cognito["scope_string"]
+            scope=cognito["scope_string"],
+            tools_cache_path=os.path.join(
+                TOOLS_CACHE_DIR,
+                f"tools_{hashlib.sha1(gateway_url.encode()).hexdigest()}.json"
+            )
         )
@@ -1,25 +1,25 @@
 """
 Test script for AgentCore Gateway integration.
+
+Run from the src directory as a module:
+    python -m gateway_integration.test_integration
 """
 
 import os
-import sys
 
-# Add src directory to path for imports
-src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, src_dir)
+from .mcp_client import MCPGatewayClient
+from .langchain_tools import create_gateway_tools
 
-from gateway_integration.mcp_client import MCPGatewayClient
-from gateway_integration.langchain_tools import create_gateway_tools
+# Gateway configuration written by the agentcore_gateway setup scripts
+CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "agentcore_gateway",
+    "gateway_config.json"
+)
 
 
 def main():
-    config_path = os.path.join(
-        os.path.dirname(__file__),
-        "..",
-        "agentcore_gateway",
-        "gateway_config.json"
-    )
+    config_path = CONFIG_PATH
     
     print("=" * 60)
     print("Testing AgentCore Gateway Integration")
@@ -29,7 +29,7 @@ def main():
     client = MCPGatewayClient.from_config(config_path)
     
     print("Initializing MCP connection...")
-    if not client.initialize():
+    if not client.bootstrap():
         print("Failed to initialize MCP connection")
         return
     
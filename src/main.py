@@ -1,15 +1,48 @@
 """Main entry point for AWS Resource Manager."""
 
 import asyncio
+import sys
+import threading
 from typing import Optional
 from agent import AWSResourceAgent
-from utils import setup_logging
+from utils import setup_logging, run_async
 from config import settings
 import structlog
 
 logger = structlog.get_logger()
 
 
+async def read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+    
+    The blocking ``input()`` call runs on a daemon thread so an unanswered
+    prompt never keeps the process alive after the loop exits.
+    
+    Args:
+        prompt: Prompt to display
+        
+    Returns:
+        Line entered by the user
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _resolve(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def _read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(_resolve, future.set_result, line)
+
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
 async def main():
     """Main application entry point."""
     # Setup logging
@@ -27,6 +60,9 @@ async def main():
     # Initialize agent
     agent = AWSResourceAgent()
     
+    # Keep stdout line-buffered even when piped so each reply is written in one flush
+    sys.stdout.reconfigure(line_buffering=True)
+    
     # Example usage
     print("AWS Resource Manager - Agentic AI Application")
     
@@ -44,7 +80,7 @@ async def main():
     
     while True:
         try:
-            user_input = input("You: ").strip()
+            user_input = (await read_input("You: ")).strip()
             
             if user_input.lower() in ['quit', 'exit', 'q']:
                 print("Goodbye!")
@@ -69,9 +105,9 @@ async def main():
             
             # Execute command
             response = await agent.execute(user_input)
-            print(f"Agent: {response}")
+            sys.stdout.write(f"Agent: {response}\n")
             
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError, asyncio.CancelledError):
             print("Goodbye!")
             break
         except Exception as e:
@@ -80,4 +116,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -1,26 +1,69 @@
 """MCP Tools module."""
 
+from typing import TYPE_CHECKING
+
 from .base_tool import BaseMCPTool, ToolInput, ToolOutput
-from .s3_tools import (
-    CreateS3BucketTool,
-    ListS3BucketsTool,
-    DeleteS3BucketTool,
-    GetS3BucketInfoTool,
-)
-from .lambda_tools import (
-    CreateLambdaFunctionTool,
-    ListLambdaFunctionsTool,
-    UpdateLambdaConfigTool,
-    DeleteLambdaFunctionTool,
-    GetLambdaFunctionInfoTool,
-)
-from .dynamodb_tools import (
-    CreateDynamoDBTableTool,
-    ListDynamoDBTablesTool,
-    DescribeDynamoDBTableTool,
-    DeleteDynamoDBTableTool,
-    UpdateDynamoDBTableTool,
-)
+
+if TYPE_CHECKING:
+    from .s3_tools import (
+        CreateS3BucketTool,
+        ListS3BucketsTool,
+        DeleteS3BucketTool,
+        GetS3BucketInfoTool,
+    )
+    from .lambda_tools import (
+        CreateLambdaFunctionTool,
+        ListLambdaFunctionsTool,
+        UpdateLambdaConfigTool,
+        DeleteLambdaFunctionTool,
+        GetLambdaFunctionInfoTool,
+    )
+    from .dynamodb_tools import (
+        CreateDynamoDBTableTool,
+        ListDynamoDBTablesTool,
+        DescribeDynamoDBTableTool,
+        DeleteDynamoDBTableTool,
+        UpdateDynamoDBTableTool,
+    )
+
+# Tool class -> defining submodule. Service modules (and boto3 with them) are
+# imported on first attribute access rather than when the package is imported.
+_LAZY = {
+    # S3
+    "CreateS3BucketTool": ".s3_tools",
+    "ListS3BucketsTool": ".s3_tools",
+    "DeleteS3BucketTool": ".s3_tools",
+    "GetS3BucketInfoTool": ".s3_tools",
+    # Lambda
+    "CreateLambdaFunctionTool": ".lambda_tools",
+    "ListLambdaFunctionsTool": ".lambda_tools",
+    "UpdateLambdaConfigTool": ".lambda_tools",
+    "DeleteLambdaFunctionTool": ".lambda_tools",
+    "GetLambdaFunctionInfoTool": ".lambda_tools",
+    # DynamoDB
+    "CreateDynamoDBTableTool": ".dynamodb_tools",
+    "ListDynamoDBTablesTool": ".dynamodb_tools",
+    "DescribeDynamoDBTableTool": ".dynamodb_tools",
+    "DeleteDynamoDBTableTool": ".dynamodb_tools",
+    "UpdateDynamoDBTableTool": ".dynamodb_tools",
+}
+
+
+def __getattr__(name: str):
+    """Import tool classes from their submodule on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Base
@@ -1,7 +1,7 @@
 """Base MCP Tool implementation."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from pydantic import BaseModel, Field
 import structlog
 
@@ -13,6 +13,112 @@ class ToolInput(BaseModel):
     pass
 
 
+def _format_buckets(buckets: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield a listing of S3 buckets."""
+    if not buckets:
+        return
+    yield "\nS3 Buckets:\n"
+    for bucket in buckets:
+        bucket_name = bucket.get('name', bucket.get('Name', 'Unknown'))
+        region_info = bucket.get('region', bucket.get('Region', 'Unknown'))
+        yield f"  • {bucket_name} (Region: {region_info})\n"
+        
+        # Add optional details
+        details = []
+        if 'versioning' in bucket:
+            details.append(f"Versioning: {bucket['versioning']}")
+        if 'encryption' in bucket:
+            details.append(f"Encryption: {bucket['encryption']}")
+        if 'public_access' in bucket:
+            details.append(f"Public Access: {bucket['public_access']}")
+        if 'tags' in bucket:
+            tag_str = ', '.join([f"{k}={v}" for k, v in bucket['tags'].items()])
+            details.append(f"Tags: {tag_str}")
+        if 'creation_date' in bucket:
+            details.append(f"Created: {bucket['creation_date']}")
+        
+        if details:
+            yield f"    {' | '.join(details)}\n"
+
+
+def _format_functions(functions: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield a listing of Lambda functions."""
+    if not functions:
+        return
+    yield "\nLambda Functions:\n"
+    for func in functions:
+        func_name = func.get('function_name', func.get('FunctionName', 'Unknown'))
+        runtime = func.get('runtime', func.get('Runtime', 'Unknown'))
+        memory = func.get('memory_size', func.get('MemorySize', 0))
+        timeout = func.get('timeout', func.get('Timeout', 0))
+        yield f"  • {func_name}\n"
+        yield f"    Runtime: {runtime} | Memory: {memory}MB | Timeout: {timeout}s\n"
+        
+        # Add optional details
+        if 'vpc_id' in func:
+            yield f"    VPC: {func['vpc_id']}"
+            if 'subnets' in func:
+                yield f" ({func['subnets']} subnets)"
+            yield "\n"
+        if 'env_vars_count' in func:
+            yield f"    Environment Variables: {func['env_vars_count']}\n"
+        if 'tags' in func:
+            tag_str = ', '.join([f"{k}={v}" for k, v in func['tags'].items()])
+            yield f"    Tags: {tag_str}\n"
+
+
+def _format_tables(tables: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield a listing of DynamoDB tables."""
+    if not tables:
+        return
+    yield "\nDynamoDB Tables:\n"
+    for table in tables:
+        table_name = table.get('table_name', table.get('TableName', table.get('name', 'Unknown')))
+        if len(table) == 1:
+            # Name-only listing (table details were not requested)
+            yield f"  • {table_name}\n"
+        else:
+            status = table.get('status', table.get('Status', 'Unknown'))
+            yield f"  • {table_name} (Status: {status})\n"
+        
+        # Add optional details
+        details = []
+        if 'billing_mode' in table:
+            details.append(f"Billing: {table['billing_mode']}")
+        if 'item_count' in table:
+            details.append(f"Items: {table['item_count']:,}")
+        if 'partition_key' in table:
+            key_info = f"PK: {table['partition_key']}"
+            if 'sort_key' in table:
+                key_info += f", SK: {table['sort_key']}"
+            details.append(key_info)
+        if 'stream_view_type' in table:
+            details.append(f"Stream: {table['stream_view_type']}")
+        
+        if details:
+            yield f"    {' | '.join(details)}\n"
+        
+        if 'tags' in table:
+            tag_str = ', '.join([f"{k}={v}" for k, v in table['tags'].items()])
+            yield f"    Tags: {tag_str}\n"
+
+
+def _format_details(data: Dict[str, Any]) -> Iterator[str]:
+    """Yield other data as key-value pairs."""
+    yield "\nDetails:\n"
+    for key, value in data.items():
+        if key != "count":
+            yield f"  {key}: {value}\n"
+
+
+# Data key -> formatter, checked in order; the first key present wins
+_FORMATTERS: Tuple[Tuple[str, Callable[[Any], Iterator[str]]], ...] = (
+    ("buckets", _format_buckets),
+    ("functions", _format_functions),
+    ("tables", _format_tables),
+)
+
+
 class ToolOutput(BaseModel):
     """Base output model for MCP tools."""
     success: bool
@@ -22,101 +128,59 @@ class ToolOutput(BaseModel):
     
     def __str__(self) -> str:
         """Format tool output as a readable string."""
+        return self.format()
+    
+    def format(self, max_chars: Optional[int] = None) -> str:
+        """Format tool output as a readable string.
+        
+        Formatting is incremental, so with ``max_chars`` set it stops as soon
+        as the budget is reached instead of rendering every item.
+        
+        Args:
+            max_chars: Maximum length of the text before the truncation marker
+            
+        Returns:
+            Formatted output
+        """
+        if max_chars is None:
+            return "".join(self._fragments())
+        
+        parts = []
+        total = 0
+        for fragment in self._fragments():
+            parts.append(fragment)
+            total += len(fragment)
+            if total > max_chars:
+                return "".join(parts)[:max_chars] + "…(truncated)"
+        return "".join(parts)
+    
+    def _fragments(self) -> Iterator[str]:
+        """Yield the formatted output piece by piece."""
         if not self.success:
-            return f"Error: {self.error or self.message}"
+            yield f"Error: {self.error or self.message}"
+            return
         
-        result = f"{self.message}\n"
-        if self.data:
+        yield f"{self.message}\n"
+        data = self.data
+        if data:
             # Format data in a natural, readable way
-            if "buckets" in self.data:
-                buckets = self.data.get("buckets", [])
-                if buckets:
-                    result += "\nS3 Buckets:\n"
-                    for bucket in buckets:
-                        bucket_name = bucket.get('name', bucket.get('Name', 'Unknown'))
-                        region_info = bucket.get('region', bucket.get('Region', 'Unknown'))
-                        result += f"  • {bucket_name} (Region: {region_info})\n"
-                        
-                        # Add optional details
-                        details = []
-                        if 'versioning' in bucket:
-                            details.append(f"Versioning: {bucket['versioning']}")
-                        if 'encryption' in bucket:
-                            details.append(f"Encryption: {bucket['encryption']}")
-                        if 'public_access' in bucket:
-                            details.append(f"Public Access: {bucket['public_access']}")
-                        if 'tags' in bucket:
-                            tag_str = ', '.join([f"{k}={v}" for k, v in bucket['tags'].items()])
-                            details.append(f"Tags: {tag_str}")
-                        if 'creation_date' in bucket:
-                            details.append(f"Created: {bucket['creation_date']}")
-                        
-                        if details:
-                            result += f"    {' | '.join(details)}\n"
-            elif "functions" in self.data:
-                functions = self.data.get("functions", [])
-                if functions:
-                    result += "\nLambda Functions:\n"
-                    for func in functions:
-                        func_name = func.get('function_name', func.get('FunctionName', 'Unknown'))
-                        runtime = func.get('runtime', func.get('Runtime', 'Unknown'))
-                        memory = func.get('memory_size', func.get('MemorySize', 0))
-                        timeout = func.get('timeout', func.get('Timeout', 0))
-                        result += f"  • {func_name}\n"
-                        result += f"    Runtime: {runtime} | Memory: {memory}MB | Timeout: {timeout}s\n"
-                        
-                        # Add optional details
-                        if 'vpc_id' in func:
-                            result += f"    VPC: {func['vpc_id']}"
-                            if 'subnets' in func:
-                                result += f" ({func['subnets']} subnets)"
-                            result += "\n"
-                        if 'env_vars_count' in func:
-                            result += f"    Environment Variables: {func['env_vars_count']}\n"
-                        if 'tags' in func:
-                            tag_str = ', '.join([f"{k}={v}" for k, v in func['tags'].items()])
-                            result += f"    Tags: {tag_str}\n"
-            elif "tables" in self.data:
-                tables = self.data.get("tables", [])
-                if tables:
-                    result += "\nDynamoDB Tables:\n"
-                    for table in tables:
-                        table_name = table.get('table_name', table.get('TableName', table.get('name', 'Unknown')))
-                        status = table.get('status', table.get('Status', 'Unknown'))
-                        result += f"  • {table_name} (Status: {status})\n"
-                        
-                        # Add optional details
-                        details = []
-                        if 'billing_mode' in table:
-                            details.append(f"Billing: {table['billing_mode']}")
-                        if 'item_count' in table:
-                            details.append(f"Items: {table['item_count']:,}")
-                        if 'partition_key' in table:
-                            key_info = f"PK: {table['partition_key']}"
-                            if 'sort_key' in table:
-                                key_info += f", SK: {table['sort_key']}"
-                            details.append(key_info)
-                        if 'stream_view_type' in table:
-                            details.append(f"Stream: {table['stream_view_type']}")
-                        
-                        if details:
-                            result += f"    {' | '.join(details)}\n"
-                        
-                        if 'tags' in table:
-                            tag_str = ', '.join([f"{k}={v}" for k, v in table['tags'].items()])
-                            result += f"    Tags: {tag_str}\n"
+            for key, formatter in _FORMATTERS:
+                if key in data:
+                    yield from formatter(data[key])
+                    break
             else:
-                # For other data types, format key-value pairs
-                result += "\nDetails:\n"
-                for key, value in self.data.items():
-                    if key != "count":
-                        result += f"  {key}: {value}\n"
-        return result
+                yield from _format_details(data)
 
 
 class BaseMCPTool(ABC):
     """Base class for all MCP tools."""
 
+    # Tools that mutate AWS resources set this so the agent runs them one at a time
+    serialize: bool = False
+    # Tools whose execute makes blocking boto3 calls without awaiting; the agent
+    # runs these on a worker thread so they do not hold the event loop
+    blocking: bool = True
+
     def __init__(self, name: str, description: str):
         """Initialize the tool.
         
@@ -143,14 +207,20 @@ class BaseMCPTool(ABC):
     def validate_input(self, input_data: Dict[str, Any]) -> ToolInput:
         """Validate and parse input data.
         
+        Inputs that are already instances of the input model are returned
+        as-is; raw dicts go straight to the model's compiled validator.
+        
         Args:
-            input_data: Raw input data
+            input_data: Raw input data (or an already-validated input model)
             
         Returns:
             Validated input model
         """
+        input_model = self.input_model
+        if isinstance(input_data, input_model):
+            return input_data
         try:
-            return self.input_model(**input_data)
+            return input_model.model_validate(input_data)
         except Exception as e:
             self.logger.error("input_validation_failed", error=str(e))
             raise ValueError(f"Invalid input: {str(e)}")
@@ -1,5 +1,6 @@
 """DynamoDB MCP Tools for table management (no data operations)."""
 
+import asyncio
 from typing import Dict, Any, Optional, List
 from pydantic import Field
 import boto3
@@ -8,6 +9,10 @@ from botocore.exceptions import ClientError
 from .base_tool import BaseMCPTool, ToolInput, ToolOutput
 from config import settings
 
+# Concurrent describe_table calls when listing tables; matches botocore's
+# default connection pool size so worker threads never wait on a connection
+MAX_CONCURRENT_DESCRIBES = 10
+
 
 class CreateDynamoDBTableInput(ToolInput):
     """Input for creating a DynamoDB table."""
@@ -26,6 +31,8 @@ class CreateDynamoDBTableInput(ToolInput):
 class CreateDynamoDBTableTool(BaseMCPTool):
     """Tool to create DynamoDB tables."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="create_dynamodb_table",
@@ -137,11 +144,18 @@ class ListDynamoDBTablesInput(ToolInput):
         description="Filter tables by tags. Example: {'Environment': 'Production', 'Team': 'DataTeam'}. Use when user asks for tagged tables."
     )
     limit: int = Field(default=100, description="Maximum number of tables to return")
+    include_details: bool = Field(
+        default=True,
+        description="Include status, size, billing and key details for each table. Set to False when only table names are needed; this skips a describe call per table."
+    )
 
 
 class ListDynamoDBTablesTool(BaseMCPTool):
     """Tool to list DynamoDB tables."""
 
+    # execute offloads its boto3 calls to worker threads itself
+    blocking = False
+
     def __init__(self):
         super().__init__(
             name="list_dynamodb_tables",
@@ -172,88 +186,34 @@ class ListDynamoDBTablesTool(BaseMCPTool):
             self.log_execution("list_dynamodb_tables")
 
             # Get all table names
-            paginator = self.dynamodb_client.get_paginator('list_tables')
-            all_table_names = []
-            for page in paginator.paginate(PaginationConfig={'MaxItems': input_data.limit}):
-                all_table_names.extend(page.get('TableNames', []))
+            all_table_names = await asyncio.to_thread(self._list_table_names, input_data.limit)
             
             # Apply name pattern filter early
             if input_data.name_pattern:
-                all_table_names = [t for t in all_table_names if input_data.name_pattern.lower() in t.lower()]
+                pattern = input_data.name_pattern.lower()
+                all_table_names = [t for t in all_table_names if pattern in t.lower()]
+
+            needs_describe = (
+                input_data.include_details
+                or input_data.billing_mode
+                or input_data.table_status
+                or input_data.has_streams is not None
+                or input_data.tags
+            )
+            if needs_describe:
+                # Describe the tables concurrently; each worker thread makes its
+                # own blocking describe (and tag) calls on the shared client
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_DESCRIBES)
 
-            filtered_tables = []
-            
-            for table_name in all_table_names:
-                try:
-                    # Get detailed table information
-                    table_desc = self.dynamodb_client.describe_table(TableName=table_name)
-                    table = table_desc['Table']
-                    
-                    # Apply billing mode filter
-                    if input_data.billing_mode:
-                        table_billing = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
-                        if table_billing != input_data.billing_mode:
-                            continue
-                    
-                    # Apply status filter
-                    if input_data.table_status:
-                        if table.get('TableStatus') != input_data.table_status:
-                            continue
-                    
-                    # Apply streams filter
-                    if input_data.has_streams is not None:
-                        stream_spec = table.get('StreamSpecification', {})
-                        stream_enabled = stream_spec.get('StreamEnabled', False)
-                        if stream_enabled != input_data.has_streams:
-                            continue
-                    
-                    # Apply tags filter
-                    table_tags = None
-                    if input_data.tags:
-                        try:
-                            tags_response = self.dynamodb_client.list_tags_of_resource(
-                                ResourceArn=table['TableArn']
-                            )
-                            table_tags = {tag['Key']: tag['Value'] for tag in tags_response.get('Tags', [])}
-                            if not all(table_tags.get(k) == v for k, v in input_data.tags.items()):
-                                continue
-                        except Exception as e:
-                            self.logger.warning(f"Could not get tags for table {table_name}: {str(e)}")
-                            continue
-                    
-                    # Build table info
-                    table_info = {
-                        "table_name": table_name,
-                        "status": table.get('TableStatus', 'Unknown'),
-                        "item_count": table.get('ItemCount', 0),
-                        "size_bytes": table.get('TableSizeBytes', 0),
-                        "billing_mode": table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED'),
-                        "creation_date": table.get('CreationDateTime', '').isoformat() if table.get('CreationDateTime') else 'Unknown'
-                    }
-                    
-                    # Add key schema
-                    key_schema = table.get('KeySchema', [])
-                    partition_key = next((k['AttributeName'] for k in key_schema if k['KeyType'] == 'HASH'), None)
-                    sort_key = next((k['AttributeName'] for k in key_schema if k['KeyType'] == 'RANGE'), None)
-                    if partition_key:
-                        table_info['partition_key'] = partition_key
-                    if sort_key:
-                        table_info['sort_key'] = sort_key
-                    
-                    # Add stream info
-                    stream_spec = table.get('StreamSpecification', {})
-                    if stream_spec.get('StreamEnabled'):
-                        table_info['stream_view_type'] = stream_spec.get('StreamViewType', 'Unknown')
-                    
-                    # Add tags if checked
-                    if table_tags:
-                        table_info['tags'] = table_tags
-                    
-                    filtered_tables.append(table_info)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error processing table {table_name}: {str(e)}")
-                    continue
+                async def describe(table_name: str) -> Optional[Dict[str, Any]]:
+                    async with semaphore:
+                        return await asyncio.to_thread(self._describe_table, table_name, input_data)
+
+                results = await asyncio.gather(*(describe(name) for name in all_table_names))
+                filtered_tables = [table_info for table_info in results if table_info is not None]
+            else:
+                # Names only and no metadata filters: ListTables already has everything
+                filtered_tables = [{"table_name": name} for name in all_table_names]
 
             # Build message with filters
             filters_applied = []
@@ -283,6 +243,99 @@ class ListDynamoDBTablesTool(BaseMCPTool):
         except Exception as e:
             return self.handle_error(e, "list_dynamodb_tables")
 
+    def _list_table_names(self, limit: int) -> List[str]:
+        """List up to ``limit`` table names (blocking; runs on a worker thread)."""
+        paginator = self.dynamodb_client.get_paginator('list_tables')
+        table_names = []
+        for page in paginator.paginate(PaginationConfig={'MaxItems': limit}):
+            table_names.extend(page.get('TableNames', []))
+        return table_names
+
+    def _describe_table(
+        self,
+        table_name: str,
+        input_data: ListDynamoDBTablesInput
+    ) -> Optional[Dict[str, Any]]:
+        """Describe one table and apply the listing filters to it.
+        
+        Args:
+            table_name: Table to describe
+            input_data: Listing parameters
+            
+        Returns:
+            Table info, or None if the table is filtered out or cannot be described
+        """
+        try:
+            # Get detailed table information
+            table_desc = self.dynamodb_client.describe_table(TableName=table_name)
+            table = table_desc['Table']
+            
+            # Apply billing mode filter
+            if input_data.billing_mode:
+                table_billing = table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED')
+                if table_billing != input_data.billing_mode:
+                    return None
+            
+            # Apply status filter
+            if input_data.table_status:
+                if table.get('TableStatus') != input_data.table_status:
+                    return None
+            
+            # Apply streams filter
+            if input_data.has_streams is not None:
+                stream_spec = table.get('StreamSpecification', {})
+                stream_enabled = stream_spec.get('StreamEnabled', False)
+                if stream_enabled != input_data.has_streams:
+                    return None
+            
+            # Apply tags filter
+            table_tags = None
+            if input_data.tags:
+                try:
+                    tags_response = self.dynamodb_client.list_tags_of_resource(
+                        ResourceArn=table['TableArn']
+                    )
+                    table_tags = {tag['Key']: tag['Value'] for tag in tags_response.get('Tags', [])}
+                    if not all(table_tags.get(k) == v for k, v in input_data.tags.items()):
+                        return None
+                except Exception as e:
+                    self.logger.warning(f"Could not get tags for table {table_name}: {str(e)}")
+                    return None
+            
+            # Build table info
+            table_info = {
+                "table_name": table_name,
+                "status": table.get('TableStatus', 'Unknown'),
+                "item_count": table.get('ItemCount', 0),
+                "size_bytes": table.get('TableSizeBytes', 0),
+                "billing_mode": table.get('BillingModeSummary', {}).get('BillingMode', 'PROVISIONED'),
+                "creation_date": table.get('CreationDateTime', '').isoformat() if table.get('CreationDateTime') else 'Unknown'
+            }
+            
+            # Add key schema
+            key_schema = table.get('KeySchema', [])
+            partition_key = next((k['AttributeName'] for k in key_schema if k['KeyType'] == 'HASH'), None)
+            sort_key = next((k['AttributeName'] for k in key_schema if k['KeyType'] == 'RANGE'), None)
+            if partition_key:
+                table_info['partition_key'] = partition_key
+            if sort_key:
+                table_info['sort_key'] = sort_key
+            
+            # Add stream info
+            stream_spec = table.get('StreamSpecification', {})
+            if stream_spec.get('StreamEnabled'):
+                table_info['stream_view_type'] = stream_spec.get('StreamViewType', 'Unknown')
+            
+            # Add tags if checked
+            if table_tags:
+                table_info['tags'] = table_tags
+            
+            return table_info
+            
+        except Exception as e:
+            self.logger.warning(f"Error processing table {table_name}: {str(e)}")
+            return None
+
 
 class DescribeDynamoDBTableInput(ToolInput):
     """Input for describing a DynamoDB table."""
@@ -361,6 +414,8 @@ class DeleteDynamoDBTableInput(ToolInput):
 class DeleteDynamoDBTableTool(BaseMCPTool):
     """Tool to delete DynamoDB tables."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="delete_dynamodb_table",
@@ -412,6 +467,8 @@ class UpdateDynamoDBTableInput(ToolInput):
 class UpdateDynamoDBTableTool(BaseMCPTool):
     """Tool to update DynamoDB table configuration."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="update_dynamodb_table",
@@ -29,6 +29,8 @@ class CreateLambdaFunctionInput(ToolInput):
 class CreateLambdaFunctionTool(BaseMCPTool):
     """Tool to create Lambda functions."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="create_lambda_function",
@@ -321,6 +323,8 @@ class UpdateLambdaConfigInput(ToolInput):
 class UpdateLambdaConfigTool(BaseMCPTool):
     """Tool to update Lambda function configuration."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="update_lambda_config",
@@ -383,6 +387,8 @@ class DeleteLambdaFunctionInput(ToolInput):
 class DeleteLambdaFunctionTool(BaseMCPTool):
     """Tool to delete Lambda functions."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="delete_lambda_function",
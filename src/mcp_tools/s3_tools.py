@@ -22,6 +22,8 @@ class CreateS3BucketInput(ToolInput):
 class CreateS3BucketTool(BaseMCPTool):
     """Tool to create S3 buckets with configuration."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="create_s3_bucket",
@@ -376,6 +378,8 @@ class DeleteS3BucketInput(ToolInput):
 class DeleteS3BucketTool(BaseMCPTool):
     """Tool to delete S3 buckets."""
 
+    serialize = True
+
     def __init__(self):
         super().__init__(
             name="delete_s3_bucket",
@@ -1,9 +1,22 @@
 """Utilities module."""
 
-from .helpers import setup_logging, format_tool_output, parse_aws_arn, validate_resource_name
+from .helpers import (
+    setup_logging,
+    run_async,
+    get_background_loop,
+    run_in_background_loop,
+    stream_in_background_loop,
+    format_tool_output,
+    parse_aws_arn,
+    validate_resource_name,
+)
 
 __all__ = [
     "setup_logging",
+    "run_async",
+    "get_background_loop",
+    "run_in_background_loop",
+    "stream_in_background_loop",
     "format_tool_output",
     "parse_aws_arn",
     "validate_resource_name",
@@ -1,23 +1,146 @@
 """Utility functions for the application."""
 
+import asyncio
+import atexit
+import queue
 import structlog
 import logging
-from typing import Any, Dict
-import json
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, AsyncIterator, BinaryIO, Callable, Coroutine, Dict, List, Optional, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+    import json
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is optional (not available on Windows)
+    uvloop = None
+
+T = TypeVar("T")
+
+
+# Queue marker telling the writer thread to finish its current batch and exit
+_STOP_WRITER = object()
+
+
+class BufferedBytesLogger:
+    """structlog logger that hands rendered lines to a background writer.
+    
+    Log calls only enqueue the already-rendered bytes; a daemon thread drains
+    the queue and writes each batch with a single ``write`` call, so request
+    paths never wait on the stdout lock or the write syscall. At exit the
+    writer is stopped and joined before the remaining lines are flushed, so a
+    batch it already dequeued is not lost.
+    """
+
+    def __init__(self, file: Optional[BinaryIO] = None):
+        # When writing under sys.stdout, pending text output (print) is
+        # flushed first so it does not interleave with log lines
+        self._text = sys.stdout if file is None else None
+        self._file = file or sys.stdout.buffer
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._writer = threading.Thread(target=self._drain_forever, name="log-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def msg(self, message: bytes) -> None:
+        """Queue a rendered log line."""
+        self._queue.put(message)
+
+    log = debug = info = warn = warning = msg
+    error = err = critical = exception = fatal = failure = msg
+
+    def flush(self) -> None:
+        """Write out everything queued so far."""
+        self._write_batch(self._take_pending([]))
+
+    def close(self) -> None:
+        """Stop the writer thread, wait for its in-flight batch, then flush the rest."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP_WRITER)
+            self._writer.join(timeout=5)
+        self.flush()
+
+    def _take_pending(self, batch: List[Any]) -> List[Any]:
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _write_batch(self, batch: List[bytes]) -> None:
+        if not batch:
+            return
+        batch.append(b"")
+        with self._write_lock:
+            if self._text is not None:
+                self._text.flush()
+            self._file.write(b"\n".join(batch))
+            self._file.flush()
+
+    def _drain_forever(self) -> None:
+        while True:
+            batch = self._take_pending([self._queue.get()])
+            stopping = any(message is _STOP_WRITER for message in batch)
+            if stopping:
+                batch = [message for message in batch if message is not _STOP_WRITER]
+            self._write_batch(batch)
+            if stopping:
+                return
+
+
+_buffered_logger: Optional[BufferedBytesLogger] = None
+
+
+def _buffered_logger_factory(*args: Any) -> BufferedBytesLogger:
+    """structlog logger factory sharing one BufferedBytesLogger per process."""
+    global _buffered_logger
+    if _buffered_logger is None:
+        _buffered_logger = BufferedBytesLogger()
+    return _buffered_logger
 
 
 def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     """Set up structured logging.
     
+    JSON logs use structlog's fast path: a filtering bound logger rendering
+    orjson bytes that a background thread writes to stdout in batches,
+    bypassing the stdlib logging bridge. Third-party libraries keep logging
+    through the stdlib root logger.
+    
     Args:
         log_level: Logging level
         log_format: Log format (json or console)
     """
+    level = getattr(logging, log_level.upper())
     logging.basicConfig(
         format="%(message)s",
-        level=getattr(logging, log_level.upper())
+        level=level
     )
 
+    if log_format == "json" and orjson is not None:
+        structlog.configure(
+            processors=[
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(serializer=orjson.dumps),
+            ],
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            context_class=dict,
+            logger_factory=_buffered_logger_factory,
+            cache_logger_on_first_use=True,
+        )
+        return
+
     processors = [
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
@@ -43,6 +166,131 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     )
 
 
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop.
+    
+    Uses uvloop when it is installed and the default asyncio loop otherwise.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        The coroutine's result
+    """
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+def _jsonable(obj: Any) -> Any:
+    """Serializer hook turning Pydantic models into plain data."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Worker threads behind the background loop's default executor. Every
+# invocation sharing the loop sends its blocking work there (Bedrock stream
+# reads, boto3 tool calls, memory writes), so the pool is sized for several
+# concurrent invocations rather than asyncio's CPU-based default
+BACKGROUND_LOOP_WORKERS = 64
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop running on a daemon thread.
+    
+    The loop is started on first use and lives for the rest of the process,
+    so connection pools and other loop-bound state survive across calls.
+    Like run_async, it uses uvloop when it is installed.
+    
+    All invocations share this loop, so coroutines run on it must not block:
+    blocking calls go through ``asyncio.to_thread``, which uses a default
+    executor of BACKGROUND_LOOP_WORKERS threads.
+    
+    Returns:
+        The running background event loop
+    """
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=BACKGROUND_LOOP_WORKERS, thread_name_prefix="event-loop-worker"
+                ))
+                threading.Thread(
+                    target=loop.run_forever, name="event-loop", daemon=True
+                ).start()
+                _background_loop = loop
+    return _background_loop
+
+
+def run_in_background_loop(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the background event loop and wait for its result.
+    
+    Args:
+        coro: Coroutine to run
+        timeout: Seconds to wait before cancelling the coroutine (None waits forever)
+        
+    Returns:
+        The coroutine's result
+        
+    Raises:
+        TimeoutError: If the coroutine does not finish within ``timeout``
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_background_loop())
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+# Returned by _next_item once an async iterator is exhausted
+_EXHAUSTED = object()
+
+
+async def _next_item(iterator: AsyncIterator[T]) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _EXHAUSTED
+
+
+async def stream_in_background_loop(iterator: AsyncIterator[T]) -> AsyncIterator[T]:
+    """Drive an async iterator on the background event loop, yielding its items here.
+    
+    Each item is produced on the background loop and awaited from the
+    caller's loop, so the caller's loop (e.g. the server answering health
+    checks) only relays results. If the consumer stops early, the iterator
+    is closed on the background loop.
+    
+    Args:
+        iterator: Async iterator (typically an async generator) to drive
+        
+    Yields:
+        The iterator's items
+    """
+    loop = get_background_loop()
+    try:
+        while True:
+            item = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(_next_item(iterator), loop)
+            )
+            if item is _EXHAUSTED:
+                return
+            yield item
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(aclose(), loop))
+
+
 def format_tool_output(output: Any) -> str:
     """Format tool output for display.
     
@@ -52,35 +300,83 @@ def format_tool_output(output: Any) -> str:
     Returns:
         Formatted string
     """
-    if hasattr(output, 'dict'):
-        return json.dumps(output.dict(), indent=2)
-    elif isinstance(output, dict):
-        return json.dumps(output, indent=2)
-    return str(output)
+    if not (isinstance(output, dict) or hasattr(output, "model_dump") or hasattr(output, "dict")):
+        return str(output)
+
+    if orjson is not None:
+        return orjson.dumps(output, default=_jsonable, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(output, default=_jsonable, indent=2)
+
+
+_ARN_RE = re.compile(r"^([^:]*):([^:]*):([^:]*):([^:]*):([^:]*):(.*)$", re.DOTALL)
+_ARN_KEYS = ("arn", "partition", "service", "region", "account_id", "resource")
+
+
+@lru_cache(maxsize=4096)
+def _match_arn(arn: str) -> Optional[tuple]:
+    """Split an ARN into its six components, or None if it is malformed (cached)."""
+    match = _ARN_RE.match(arn)
+    return match.groups() if match else None
 
 
 def parse_aws_arn(arn: str) -> Dict[str, str]:
     """Parse an AWS ARN into components.
     
+    The regex match is cached; each call returns a new dictionary, so
+    callers may modify or serialize it freely.
+    
     Args:
         arn: AWS ARN string
         
     Returns:
         Dictionary of ARN components
     """
-    parts = arn.split(":")
-    
-    if len(parts) < 6:
+    groups = _match_arn(arn)
+    if groups is None:
         return {"error": "Invalid ARN format"}
-    
-    return {
-        "arn": parts[0],
-        "partition": parts[1],
-        "service": parts[2],
-        "region": parts[3],
-        "account_id": parts[4],
-        "resource": ":".join(parts[5:])
-    }
+    return dict(zip(_ARN_KEYS, groups))
+
+
+_S3_EDGE_RE = re.compile(r"[A-Za-z0-9](?:.*[A-Za-z0-9])?", re.DOTALL)
+_S3_BAD_SEQUENCE_RE = re.compile(r"\.\.|\.-|-\.")
+_LAMBDA_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+_DYNAMODB_NAME_RE = re.compile(r"[A-Za-z0-9._-]+")
+
+
+def _validate_s3_name(name: str, length: int) -> tuple[bool, str]:
+    """Apply S3 bucket name rules."""
+    if length < 3 or length > 63:
+        return False, "S3 bucket name must be between 3 and 63 characters"
+    if not _S3_EDGE_RE.fullmatch(name):
+        return False, "S3 bucket name must start and end with letter or number"
+    if _S3_BAD_SEQUENCE_RE.search(name):
+        return False, "Invalid character combination in S3 bucket name"
+    return True, ""
+
+
+def _validate_lambda_name(name: str, length: int) -> tuple[bool, str]:
+    """Apply Lambda function name rules."""
+    if length > 64:
+        return False, "Lambda function name cannot exceed 64 characters"
+    if not _LAMBDA_NAME_RE.fullmatch(name):
+        return False, "Lambda function name can only contain alphanumeric, hyphen, and underscore"
+    return True, ""
+
+
+def _validate_dynamodb_name(name: str, length: int) -> tuple[bool, str]:
+    """Apply DynamoDB table name rules."""
+    if length < 3 or length > 255:
+        return False, "DynamoDB table name must be between 3 and 255 characters"
+    if not _DYNAMODB_NAME_RE.fullmatch(name):
+        return False, "DynamoDB table name can only contain alphanumeric, hyphen, dot, and underscore"
+    return True, ""
+
+
+_NAME_VALIDATORS: dict[str, Callable[[str, int], tuple[bool, str]]] = {
+    "s3": _validate_s3_name,
+    "lambda": _validate_lambda_name,
+    "dynamodb": _validate_dynamodb_name,
+}
 
 
 def validate_resource_name(name: str, resource_type: str) -> tuple[bool, str]:
@@ -96,27 +392,7 @@ def validate_resource_name(name: str, resource_type: str) -> tuple[bool, str]:
     if not name:
         return False, "Name cannot be empty"
     
-    if resource_type == "s3":
-        # S3 bucket name rules
-        if len(name) < 3 or len(name) > 63:
-            return False, "S3 bucket name must be between 3 and 63 characters"
-        if not name[0].isalnum() or not name[-1].isalnum():
-            return False, "S3 bucket name must start and end with letter or number"
-        if ".." in name or ".-" in name or "-." in name:
-            return False, "Invalid character combination in S3 bucket name"
-    
-    elif resource_type == "lambda":
-        # Lambda function name rules
-        if len(name) > 64:
-            return False, "Lambda function name cannot exceed 64 characters"
-        if not all(c.isalnum() or c in "-_" for c in name):
-            return False, "Lambda function name can only contain alphanumeric, hyphen, and underscore"
-    
-    elif resource_type == "dynamodb":
-        # DynamoDB table name rules
-        if len(name) < 3 or len(name) > 255:
-            return False, "DynamoDB table name must be between 3 and 255 characters"
-        if not all(c.isalnum() or c in "-._" for c in name):
-            return False, "DynamoDB table name can only contain alphanumeric, hyphen, dot, and underscore"
-    
-    return True, ""
+    validator = _NAME_VALIDATORS.get(resource_type)
+    if validator is None:
+        return True, ""
+    return validator(name, len(name))
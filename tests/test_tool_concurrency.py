@@ -0,0 +1,44 @@
+"""Tests that gathered MCP tool calls run concurrently."""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from agent.aws_agent import _call_mcp_tool  # noqa: E402
+from mcp_tools.base_tool import BaseMCPTool, ToolInput, ToolOutput  # noqa: E402
+
+# How long each fake tool blocks, in seconds
+SLEEP = 0.3
+
+
+class SlowTool(BaseMCPTool):
+    """Fake tool whose execute blocks like a boto3 call, without awaiting."""
+
+    def __init__(self, name: str):
+        super().__init__(name=name, description="Sleeps, then succeeds")
+
+    @property
+    def input_model(self) -> type[ToolInput]:
+        return ToolInput
+
+    async def execute(self, input_data: ToolInput) -> ToolOutput:
+        time.sleep(SLEEP)
+        return ToolOutput(success=True, message=f"{self.name} done")
+
+
+def test_gathered_blocking_tools_overlap():
+    tools = [SlowTool("slow_a"), SlowTool("slow_b")]
+
+    async def run_both():
+        return await asyncio.gather(*(_call_mcp_tool(tool) for tool in tools))
+
+    start = time.perf_counter()
+    results = asyncio.run(run_both())
+    elapsed = time.perf_counter() - start
+
+    assert all("done" in result for result in results)
+    # Run back to back the two calls would take 2 * SLEEP
+    assert elapsed < SLEEP * 1.8